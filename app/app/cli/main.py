@@ -24,6 +24,8 @@ from app.core.config import (
     load_config,
     save_config,
 )
+from app.core.jsonio import dumps_bytes
+from app.core.logging_setup import LOG_LEVELS
 from app.core.log_tail import build_log_tail_payload
 from app.providers.feishu_legacy import FeishuClient, SyncEngine
 from app.providers.feishu_legacy.db import init_db
@@ -82,9 +84,10 @@ def _service_status_summary(unit: str = "localfile-cloudsync.service") -> str:
 
 def _append_run_history(summary: dict) -> None:
     RUN_HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with RUN_HISTORY_PATH.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(summary, ensure_ascii=False))
-        f.write("\n")
+    line = dumps_bytes(summary) + b"\n"
+    # Unbuffered append: the whole line goes out in one O_APPEND write, so web and CLI runs never interleave.
+    with RUN_HISTORY_PATH.open("ab", buffering=0) as f:
+        f.write(line)
 
 
 def _build_sync_engine() -> tuple:
@@ -100,10 +103,10 @@ def _build_sync_engine() -> tuple:
     )
 
     def log_func(level: str, module: str, message: str, detail: str | None = None):
-        logging.getLogger(module).log(
-            getattr(logging, level.upper(), logging.INFO),
-            f"{message} {detail or ''}".strip(),
-        )
+        logger = logging.getLogger(module)
+        log_level = LOG_LEVELS.get(level.upper(), logging.INFO)
+        if logger.isEnabledFor(log_level):
+            logger.log(log_level, f"{message} {detail or ''}".strip())
 
     engine = SyncEngine(cfg.model_dump(), cfg.database.path, client, log_func)
     return cfg, engine, local_root_locked, requested_local_root
@@ -328,7 +331,8 @@ def auth_url(
     try:
         cfg, client = _build_feishu_client()
         state = secrets.token_hex(16)
-        url = client.create_oauth_authorize_url(redirect_uri=redirect_uri, state=state)
+        with client:
+            url = client.create_oauth_authorize_url(redirect_uri=redirect_uri, state=state)
         AUTH_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
         AUTH_STATE_PATH.write_text(state, encoding="utf-8")
         print(
@@ -357,7 +361,8 @@ def auth_exchange(
     """Exchange OAuth code for user token and save it to user_token_file."""
     try:
         cfg, client = _build_feishu_client()
-        token_data = client.exchange_code_for_user_token(code)
+        with client:
+            token_data = client.exchange_code_for_user_token(code)
         print(
             json.dumps(
                 {
@@ -390,7 +395,8 @@ def auth_refresh(
     """Refresh user access token using refresh_token."""
     try:
         cfg, client = _build_feishu_client()
-        token_data = client.refresh_user_access_token(force=force)
+        with client:
+            token_data = client.refresh_user_access_token(force=force)
         print(
             json.dumps(
                 {
@@ -565,13 +571,14 @@ def run_once(
                 "applied_local_root": FIXED_LOCAL_ROOT,
             }
         LAST_RUN_ONCE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        LAST_RUN_ONCE_PATH.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+        LAST_RUN_ONCE_PATH.write_bytes(dumps_bytes(summary, indent=True))
         _append_run_history(summary)
-        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        print(dumps_bytes(summary, indent=True).decode("utf-8"))
         return
 
     _cfg, engine, local_root_locked, requested_local_root = _build_sync_engine()
-    summary = engine.run_once(run_type=run_type)
+    with engine.client:
+        summary = engine.run_once(run_type=run_type)
     if local_root_locked:
         summary["scope_warning"] = {
             "code": "local_root_scope_locked",
@@ -579,9 +586,9 @@ def run_once(
             "applied_local_root": FIXED_LOCAL_ROOT,
         }
     LAST_RUN_ONCE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    LAST_RUN_ONCE_PATH.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    LAST_RUN_ONCE_PATH.write_bytes(dumps_bytes(summary, indent=True))
     _append_run_history(summary)
-    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    print(dumps_bytes(summary, indent=True).decode("utf-8"))
     if summary.get("fatal_error") or int(summary.get("errors", 0)) > 0:
         raise typer.Exit(2)
 
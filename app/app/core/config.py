@@ -110,6 +110,10 @@ FIXED_LOCAL_ROOT_NORMALIZED = _normalize_local_root(FIXED_LOCAL_ROOT)
 
 
 def is_local_root_in_scope(value: str) -> bool:
+    # enforce_local_root_scope stores FIXED_LOCAL_ROOT verbatim, so the common case
+    # is an exact string match that needs no resolve() syscalls.
+    if value == FIXED_LOCAL_ROOT or value == FIXED_LOCAL_ROOT_NORMALIZED:
+        return True
     return _normalize_local_root(value) == FIXED_LOCAL_ROOT_NORMALIZED
 
 
@@ -129,6 +133,21 @@ def ensure_runtime_dirs(cfg: AppConfig):
     Path(cfg.database.path).parent.mkdir(parents=True, exist_ok=True)
 
 
+def _yaml_load(text: str):
+    import yaml
+
+    # libyaml's CSafeLoader is much faster than the pure-Python SafeLoader and is safe_load-equivalent.
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+# Parsed configs keyed by path; an entry is reused while the file's (mtime_ns, size) is unchanged.
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], AppConfig]] = {}
+
+
+def clear_config_cache() -> None:
+    _CONFIG_CACHE.clear()
+
+
 def load_config(path: Path = DEFAULT_CONFIG_PATH) -> AppConfig:
     import yaml
 
@@ -137,7 +156,7 @@ def load_config(path: Path = DEFAULT_CONFIG_PATH) -> AppConfig:
         if DEFAULT_CONFIG_TEMPLATE_PATH.exists():
             try:
                 template_text = DEFAULT_CONFIG_TEMPLATE_PATH.read_text(encoding="utf-8")
-                data = yaml.safe_load(template_text) or {}
+                data = _yaml_load(template_text) or {}
                 cfg = AppConfig.model_validate(data)
                 path.write_text(template_text, encoding="utf-8")
             except Exception:
@@ -149,8 +168,17 @@ def load_config(path: Path = DEFAULT_CONFIG_PATH) -> AppConfig:
         ensure_runtime_dirs(cfg)
         return cfg
 
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    cfg = AppConfig.model_validate(data)
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(str(path))
+    if cached is not None and cached[0] == key:
+        # Callers mutate the returned config (scope enforcement, config updates).
+        cfg = cached[1].model_copy(deep=True)
+    else:
+        data = _yaml_load(path.read_text(encoding="utf-8")) or {}
+        cfg = AppConfig.model_validate(data)
+        _CONFIG_CACHE[str(path)] = (key, cfg.model_copy(deep=True))
+    # Not cached: runtime dirs removed while the service runs must be recreated.
     ensure_runtime_dirs(cfg)
     return cfg
 
@@ -160,3 +188,4 @@ def save_config(cfg: AppConfig, path: Path = DEFAULT_CONFIG_PATH):
 
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(yaml.safe_dump(cfg.model_dump(), allow_unicode=True, sort_keys=False), encoding="utf-8")
+    _CONFIG_CACHE.pop(str(path), None)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    # UTF-8 JSON with non-ASCII kept as-is (like ensure_ascii=False). orjson is used when
+    # installed; values it rejects (e.g. ints beyond 64 bits) fall back to the stdlib.
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_bytes(raw: bytes) -> Any:
+    # orjson parses UTF-8 bytes directly; the stdlib accepts bytes too.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Iterable
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+WATCHDOG_AVAILABLE = Observer is not None
+
+# Access-only notifications (watchdog >= 4 on inotify) do not change anything worth syncing.
+_IGNORED_EVENT_TYPES = frozenset({"opened", "closed_no_write"})
+
+
+class _LocalChangeHandler(FileSystemEventHandler):
+    def __init__(self, root: Path, exclude_dirs: frozenset[str], on_change: Callable[[], None]):
+        super().__init__()
+        self._root = root
+        self._exclude_dirs = exclude_dirs
+        self._on_change = on_change
+
+    def _excluded(self, raw_path: str) -> bool:
+        try:
+            parts = Path(raw_path).relative_to(self._root).parts
+        except ValueError:
+            return True
+        return any(part in self._exclude_dirs for part in parts)
+
+    def on_any_event(self, event) -> None:
+        if event.event_type in _IGNORED_EVENT_TYPES:
+            return
+        for raw_path in (event.src_path, getattr(event, "dest_path", "")):
+            if raw_path and not self._excluded(str(raw_path)):
+                self._on_change()
+                return
+
+
+def start_local_watcher(root: str, exclude_dirs: Iterable[str], on_change: Callable[[], None]):
+    """Watch `root` recursively and call `on_change` (from the observer thread) on local edits.
+
+    Returns the started observer, or None when watchdog is not installed or `root` is missing.
+    """
+    root_path = Path(root)
+    if Observer is None or not root_path.is_dir():
+        return None
+    observer = Observer()
+    observer.schedule(
+        _LocalChangeHandler(root_path, frozenset(exclude_dirs), on_change),
+        str(root_path),
+        recursive=True,
+    )
+    observer.daemon = True
+    observer.start()
+    return observer
+
+
+def stop_local_watcher(observer) -> None:
+    if observer is None:
+        return
+    observer.stop()
+    observer.join(timeout=5)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
@@ -9,12 +10,45 @@ LOG_LINE_RE = re.compile(
 )
 
 
-def _tail_lines(path: str, n: int = 200) -> list[str]:
+TAIL_READ_BLOCK_BYTES = 64 * 1024
+
+
+def _read_last_lines(fh, size: int, n: int) -> tuple[bytes, int]:
+    # Read backwards in blocks until the buffer holds more than n line breaks (or the
+    # file start), so a full tail costs O(n lines) instead of O(file size).
+    start = size
+    blocks: list[bytes] = []
+    newlines = 0
+    while start > 0 and newlines <= n:
+        step = min(TAIL_READ_BLOCK_BYTES, start)
+        start -= step
+        fh.seek(start)
+        block = fh.read(step)
+        blocks.append(block)
+        newlines += block.count(b"\n")
+    return b"".join(reversed(blocks)), start
+
+
+def _tail_lines(path: str, n: int = 200, since: int = 0) -> tuple[list[str], int, bool]:
+    # Returns (last n lines from byte `since`, offset to resume from, reset). `reset` means
+    # `since` was past EOF (file rotated/truncated) and the whole file was read again.
     p = Path(path)
     if not p.exists():
-        return []
-    lines = p.read_text(encoding="utf-8", errors="replace").splitlines()
-    return lines[-n:]
+        return [], 0, since > 0
+    with p.open("rb") as fh:
+        size = fh.seek(0, os.SEEK_END)
+        reset = since > size
+        start = 0 if reset else max(since, 0)
+        if start == 0 and n > 0:
+            data, start = _read_last_lines(fh, size, n)
+        else:
+            fh.seek(start)
+            data = fh.read()
+    # Stop at the last complete line: a record still being written is returned (whole) by the
+    # next incremental fetch instead of being split across two.
+    data = data[: data.rfind(b"\n") + 1]
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return lines[-n:], start + len(data), reset
 
 
 def _parse_line(line: str) -> dict[str, str]:
@@ -30,25 +64,43 @@ def _parse_line(line: str) -> dict[str, str]:
     }
 
 
-def build_log_tail_payload(path: str, n: int = 200, level: str | None = None, module: str | None = None) -> dict:
+def build_log_tail_payload(
+    path: str,
+    n: int = 200,
+    level: str | None = None,
+    module: str | None = None,
+    include_items: bool = True,
+    since: int | None = None,
+) -> dict:
     level_wanted = (level or "").strip().upper() or None
     module_wanted = (module or "").strip().lower() or None
 
+    lines, next_offset, reset = _tail_lines(path, n=n, since=since or 0)
     parsed_lines: list[dict[str, str]] = []
-    for line in _tail_lines(path, n=n):
-        item = _parse_line(line)
-        if level_wanted and item["level"].upper() != level_wanted:
-            continue
-        if module_wanted and item["module"].strip().lower() != module_wanted:
-            continue
-        parsed_lines.append(item)
+    if level_wanted or module_wanted or include_items:
+        for line in lines:
+            item = _parse_line(line)
+            if level_wanted and item["level"].upper() != level_wanted:
+                continue
+            if module_wanted and item["module"].strip().lower() != module_wanted:
+                continue
+            parsed_lines.append(item)
+        raw_lines = [item["raw"] for item in parsed_lines]
+    else:
+        # Unfiltered text-only tails (the console's default) never need the regex.
+        raw_lines = lines
 
-    return {
+    payload = {
         "path": path,
         "n": n,
         "level": level_wanted,
         "module": module_wanted,
-        "count": len(parsed_lines),
-        "tail": "\n".join(item["raw"] for item in parsed_lines),
-        "items": parsed_lines,
+        "count": len(raw_lines),
+        "tail": "\n".join(raw_lines),
+        "since": since,
+        "next_offset": next_offset,
+        "reset": reset,
     }
+    if include_items:
+        payload["items"] = parsed_lines
+    return payload
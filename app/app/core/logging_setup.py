@@ -1,17 +1,41 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
+# Level name -> number, resolved once instead of a getattr(logging, ...) per log call.
+LOG_LEVELS: dict[str, int] = {
+    name: getattr(logging, name)
+    for name in ("NOTSET", "DEBUG", "INFO", "WARN", "WARNING", "ERROR", "CRITICAL", "FATAL")
+}
+
+# Background thread that drains the root QueueHandler into the file/console handlers.
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(level: str, logfile: str):
+    global _listener
     Path(logfile).parent.mkdir(parents=True, exist_ok=True)
 
-    log_level = getattr(logging, level.upper(), logging.INFO)
+    log_level = LOG_LEVELS.get(level.upper(), logging.INFO)
     root = logging.getLogger()
     root.setLevel(log_level)
 
     # Clear existing handlers to avoid duplicates across restarts/reloads.
+    _stop_listener()
     for h in list(root.handlers):
         root.removeHandler(h)
 
@@ -20,12 +44,17 @@ def setup_logging(level: str, logfile: str):
     fh = logging.FileHandler(logfile, encoding="utf-8")
     fh.setLevel(log_level)
     fh.setFormatter(fmt)
-    root.addHandler(fh)
 
     ch = logging.StreamHandler()
     ch.setLevel(log_level)
     ch.setFormatter(fmt)
-    root.addHandler(ch)
+
+    # Callers only enqueue records; file/console writes happen on the listener thread so
+    # sync hot paths never block on disk I/O.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, fh, ch, respect_handler_level=True)
+    _listener.start()
 
     # Route uvicorn logs into the same root handlers/file.
     for logger_name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
@@ -9,8 +9,28 @@ def get_conn(db_path: str):
     return conn
 
 
+# (path, st_dev, st_ino, st_ctime_ns) of databases whose schema this process already ensured.
+# A deleted/replaced file changes ctime even if the filesystem reuses its inode; ordinary
+# writes that bump ctime merely cost one more (idempotent) schema pass.
+_initialized: set[tuple[str, int, int, int]] = set()
+
+
+def _db_identity(db_path: str) -> tuple[str, int, int, int] | None:
+    try:
+        st = Path(db_path).stat()
+    except OSError:
+        return None
+    return db_path, st.st_dev, st.st_ino, st.st_ctime_ns
+
+
 def init_db(db_path: str):
+    identity = _db_identity(db_path)
+    if identity is not None and identity in _initialized:
+        return
+
     conn = get_conn(db_path)
+    # WAL lets the web API read while a sync run writes, and makes per-statement commits cheap.
+    conn.execute("PRAGMA journal_mode=WAL")
     cur = conn.cursor()
 
     cur.execute(
@@ -114,3 +134,6 @@ def init_db(db_path: str):
 
     conn.commit()
     conn.close()
+    identity = _db_identity(db_path)
+    if identity is not None:
+        _initialized.add(identity)
@@ -1,38 +1,199 @@
-import json
+import os
+import shutil
+import stat
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from app.core.jsonio import dumps_bytes, loads_bytes
+
+try:  # optional: streams multipart uploads instead of building the whole body in memory
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:  # optional: HTTP/2 multiplexing for JSON API calls
+    import h2  # noqa: F401
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
 
 BASE = "https://open.feishu.cn/open-apis"
+# Upper bound on concurrent folder listings, to stay well inside Feishu's rate limits.
+LIST_FOLDERS_MAX_WORKERS = 8
+# Upper bound on concurrent single-item calls (delete/move/...) issued through run_batch.
+BATCH_MAX_INFLIGHT = 16
+
+
+def run_batch(fn, items, max_inflight: int = BATCH_MAX_INFLIGHT) -> list[tuple[Any, Exception | None]]:
+    """Call `fn(item)` for every item with bounded concurrency.
+
+    Returns `(item, error)` pairs in input order; `error` is None on success. Every item is
+    attempted, so callers decide how to handle failures once the whole batch is done.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        out: list[tuple[Any, Exception | None]] = []
+        for item in items:
+            try:
+                fn(item)
+                out.append((item, None))
+            except Exception as e:
+                out.append((item, e))
+        return out
+    with ThreadPoolExecutor(max_workers=min(max_inflight, len(items))) as pool:
+        futures = [pool.submit(fn, item) for item in items]
+    results: list[tuple[Any, Exception | None]] = []
+    for item, future in zip(items, futures):
+        err = future.exception()
+        if err is not None and not isinstance(err, Exception):
+            raise err  # KeyboardInterrupt/SystemExit propagate, as on the sequential path
+        results.append((item, err))
+    return results
+
+
+@lru_cache(maxsize=16)
+def _read_json_cached(path: str, ino: int, mtime_ns: int, size: int) -> Any:
+    # The stat fields are only the cache key; any rewrite (incl. os.replace) changes them.
+    return loads_bytes(Path(path).read_bytes())
+
+
+def _response_json(res: Any) -> Any:
+    # Parse the raw bytes directly; requests' .json() sniffs the charset and decodes to str first.
+    return loads_bytes(res.content)
 
 
 class FeishuClient:
+    URL_AUTHORIZE = f"{BASE}/authen/v1/index"
+    URL_ACCESS_TOKEN = f"{BASE}/authen/v1/access_token"
+    URL_REFRESH = f"{BASE}/authen/v1/refresh_access_token"
+    URL_TENANT = f"{BASE}/auth/v3/tenant_access_token/internal"
+    URL_ROOT_META = f"{BASE}/drive/explorer/v2/root_folder/meta"
+    URL_LIST = f"{BASE}/drive/v1/files"
+    URL_CREATE_FOLDER = f"{BASE}/drive/v1/files/create_folder"
+    URL_UPLOAD = f"{BASE}/drive/v1/files/upload_all"
+    URL_FILE_PREFIX = f"{BASE}/drive/v1/files/"
+    URL_META_PREFIX = f"{BASE}/drive/v1/metas/"
+
     def __init__(self, app_id: str, app_secret: str, user_token_file: str, timeout: int = 30):
         self.app_id = app_id or ""
         self.app_secret = app_secret or ""
         self.user_token_file = user_token_file or ""
         self.timeout = timeout
+        # Resolved access tokens are kept in memory until shortly before expiry, so per-call
+        # _auth_headers() does not re-read the token file or re-request a tenant token.
+        self._token_lock = threading.Lock()
+        # Held across token file loads, refreshes and tenant fetches so concurrent callers
+        # (list_folders/run_batch workers) never spend the single-use refresh_token twice.
+        self._refresh_lock = threading.Lock()
+        self._tenant_token: str | None = None
+        self._tenant_expire_at = 0.0  # time.monotonic()
+        self._user_token: str | None = None
+        self._user_expire_at = 0  # epoch ms, same clock as the token file's created_at
+        # One pooled session per client so a sync run reuses TLS connections across API calls.
+        # Only idempotent methods are retried (urllib3 default); the final response is returned as-is.
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = "localfile-cloudsync-server"
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    raise_on_status=False,
+                ),
+            ),
+        )
+        # JSON API calls share one multiplexed HTTP/2 connection when httpx[http2] is installed;
+        # uploads/downloads stay on the requests session (streaming multipart, raw copy).
+        self._api: Any = self._session
+        if httpx is not None:
+            self._api = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                    retries=3,
+                ),
+                headers={"User-Agent": "localfile-cloudsync-server"},
+                timeout=timeout,
+            )
+
+    def close(self) -> None:
+        """Release pooled connections; the client must not be used afterwards."""
+        if self._api is not self._session:
+            self._api.close()
+        self._session.close()
+
+    def __enter__(self) -> "FeishuClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _load_user_tokens(self) -> dict[str, Any] | None:
         if not self.user_token_file:
             return None
-        p = Path(self.user_token_file)
-        if not p.exists():
+        try:
+            st = os.stat(self.user_token_file)
+        except OSError:
             return None
-        payload = json.loads(p.read_text(encoding="utf-8"))
+        payload = _read_json_cached(self.user_token_file, st.st_ino, st.st_mtime_ns, st.st_size)
         if isinstance(payload, dict):
-            return payload
+            return dict(payload)  # callers may mutate; keep the cached object pristine
         return None
 
+    def _remember_user_token(self, tokens: dict[str, Any]) -> None:
+        access_token = tokens.get("access_token")
+        created = int(tokens.get("created_at", 0))
+        expires_in = int(tokens.get("expires_in", 7200))
+        with self._token_lock:
+            if isinstance(access_token, str) and access_token and created:
+                self._user_token = access_token
+                self._user_expire_at = created + max(expires_in - 300, 300) * 1000
+            else:
+                self._user_token = None
+                self._user_expire_at = 0
+
     def _save_user_tokens(self, data: dict[str, Any]) -> None:
+        self._remember_user_token(data)
         if not self.user_token_file:
             return
         p = Path(self.user_token_file)
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        body = dumps_bytes(data, indent=True)
+        # Write a sibling temp file and rename it over the original, so a crash mid-write can
+        # never leave a truncated token file behind. Keep the existing file's permissions.
+        try:
+            mode = stat.S_IMODE(p.stat().st_mode)
+        except OSError:
+            mode = 0o600
+        # A unique temp name per write: concurrent saves from separate clients (scheduler, event
+        # job, /api/auth/refresh) must not truncate or rename each other's temp file.
+        fd, tmp = tempfile.mkstemp(dir=p.parent, prefix=p.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                os.fchmod(fh.fileno(), mode)
+                fh.write(body)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, p)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
 
     def create_oauth_authorize_url(self, redirect_uri: str, state: str) -> str:
         if not self.app_id:
@@ -48,7 +209,7 @@ class FeishuClient:
                 "state": state,
             }
         )
-        return f"https://open.feishu.cn/open-apis/authen/v1/index?{query}"
+        return f"{self.URL_AUTHORIZE}?{query}"
 
     def exchange_code_for_user_token(self, code: str) -> dict[str, Any]:
         if not self.app_id or not self.app_secret:
@@ -57,8 +218,8 @@ class FeishuClient:
         if not code_text:
             raise RuntimeError("oauth_code_missing")
 
-        res = requests.post(
-            f"{BASE}/authen/v1/access_token",
+        res = self._api.post(
+            self.URL_ACCESS_TOKEN,
             json={
                 "grant_type": "authorization_code",
                 "code": code_text,
@@ -67,7 +228,7 @@ class FeishuClient:
             },
             timeout=self.timeout,
         )
-        token_data = self._check_data(res.json())
+        token_data = self._check_data(_response_json(res))
         token_data["created_at"] = int(time.time() * 1000)
         self._save_user_tokens(token_data)
         return token_data
@@ -84,8 +245,8 @@ class FeishuClient:
                 raise RuntimeError("refresh_token_missing_or_auth_incomplete")
             return None
 
-        res = requests.post(
-            f"{BASE}/authen/v1/refresh_access_token",
+        res = self._api.post(
+            self.URL_REFRESH,
             json={
                 "grant_type": "refresh_token",
                 "refresh_token": refresh,
@@ -94,7 +255,7 @@ class FeishuClient:
             },
             timeout=self.timeout,
         )
-        payload_raw = res.json()
+        payload_raw = _response_json(res)
         payload = payload_raw if isinstance(payload_raw, dict) else {}
         if payload.get("code") != 0:
             if raise_on_error:
@@ -108,6 +269,10 @@ class FeishuClient:
         return refreshed
 
     def refresh_user_access_token(self, force: bool = False) -> dict[str, Any]:
+        with self._refresh_lock:
+            return self._refresh_user_access_token_locked(force)
+
+    def _refresh_user_access_token_locked(self, force: bool) -> dict[str, Any]:
         tokens = self._load_user_tokens()
         if not tokens:
             raise RuntimeError("no_user_token_file_or_empty")
@@ -125,7 +290,24 @@ class FeishuClient:
             raise RuntimeError("refresh_token_failed_no_access_token")
         return refreshed
 
+    def _cached_user_token(self) -> str | None:
+        with self._token_lock:
+            if self._user_token and int(time.time() * 1000) < self._user_expire_at:
+                return self._user_token
+        return None
+
     def _user_access_token(self) -> str | None:
+        token = self._cached_user_token()
+        if token:
+            return token
+        with self._refresh_lock:
+            # Another thread may have loaded or refreshed the token while we waited.
+            token = self._cached_user_token()
+            if token:
+                return token
+            return self._load_user_access_token()
+
+    def _load_user_access_token(self) -> str | None:
         tokens = self._load_user_tokens()
         if not tokens:
             return None
@@ -142,6 +324,7 @@ class FeishuClient:
 
         expire_at = created + max(expires_in - 300, 300) * 1000
         if created and int(time.time() * 1000) < expire_at:
+            self._remember_user_token(tokens)
             return access_token
 
         refreshed = self._refresh_user_tokens(refresh_token, raise_on_error=False)
@@ -149,20 +332,40 @@ class FeishuClient:
             return None
         return refreshed.get("access_token")
 
+    def _cached_tenant_token(self) -> str | None:
+        with self._token_lock:
+            if self._tenant_token and time.monotonic() < self._tenant_expire_at:
+                return self._tenant_token
+        return None
+
     def _tenant_access_token(self) -> str | None:
         if not self.app_id or not self.app_secret:
             return None
-        res = requests.post(
-            f"{BASE}/auth/v3/tenant_access_token/internal",
+        token = self._cached_tenant_token()
+        if token:
+            return token
+        with self._refresh_lock:
+            token = self._cached_tenant_token()
+            if token:
+                return token
+            return self._fetch_tenant_access_token()
+
+    def _fetch_tenant_access_token(self) -> str | None:
+        res = self._api.post(
+            self.URL_TENANT,
             json={"app_id": self.app_id, "app_secret": self.app_secret},
             timeout=self.timeout,
         )
-        data_raw = res.json()
+        data_raw = _response_json(res)
         data = data_raw if isinstance(data_raw, dict) else {}
         if data.get("code") != 0:
             return None
         token = data.get("tenant_access_token")
         if isinstance(token, str) and token:
+            expire = int(data.get("expire") or 7200)
+            with self._token_lock:
+                self._tenant_token = token
+                self._tenant_expire_at = time.monotonic() + max(expire - 300, 0)
             return token
         return None
 
@@ -196,17 +399,18 @@ class FeishuClient:
     def _check_data(self, payload: dict[str, Any]) -> dict[str, Any]:
         if not isinstance(payload, dict):
             raise RuntimeError("invalid_response")
-        if payload.get("code", 0) != 0:
-            raise RuntimeError(f"feishu_error: code={payload.get('code')} msg={payload.get('msg')}")
-        data = payload.get("data", {}) or {}
+        code = payload.get("code", 0)
+        if code != 0:
+            raise RuntimeError(f"feishu_error: code={code} msg={payload.get('msg')}")
+        data = payload.get("data") or {}
         if not isinstance(data, dict):
             raise RuntimeError("invalid_response_data")
         return data
 
     def get_root_folder_token(self) -> str:
         headers, _ = self._auth_headers()
-        res = requests.get(f"{BASE}/drive/explorer/v2/root_folder/meta", headers=headers, timeout=self.timeout)
-        payload_raw = res.json()
+        res = self._api.get(self.URL_ROOT_META, headers=headers, timeout=self.timeout)
+        payload_raw = _response_json(res)
         payload = payload_raw if isinstance(payload_raw, dict) else {}
         data = self._check_data(payload)
         token = data.get("token")
@@ -227,8 +431,8 @@ class FeishuClient:
         if page_token:
             params["page_token"] = page_token
 
-        res = requests.get(f"{BASE}/drive/v1/files", params=params, headers=headers, timeout=self.timeout)
-        body_raw = res.json()
+        res = self._api.get(self.URL_LIST, params=params, headers=headers, timeout=self.timeout)
+        body_raw = _response_json(res)
         body = body_raw if isinstance(body_raw, dict) else {}
         if body.get("code", 0) != 0:
             return {"ok": False, "token_type": token_type, "error": body}
@@ -261,16 +465,23 @@ class FeishuClient:
                 break
         return items
 
+    def list_folders(self, folder_tokens: list[str]) -> list[list[dict[str, Any]]]:
+        """List several folders concurrently; results follow the order of `folder_tokens`."""
+        if len(folder_tokens) <= 1:
+            return [self.list_folder_once(token) for token in folder_tokens]
+        with ThreadPoolExecutor(max_workers=min(LIST_FOLDERS_MAX_WORKERS, len(folder_tokens))) as pool:
+            return list(pool.map(self.list_folder_once, folder_tokens))
+
     def create_folder(self, name: str, folder_token: str | None) -> str:
         headers, _ = self._auth_headers()
         parent = folder_token or self.get_root_folder_token()
-        res = requests.post(
-            f"{BASE}/drive/v1/files/create_folder",
+        res = self._api.post(
+            self.URL_CREATE_FOLDER,
             json={"name": name, "folder_token": parent},
             headers=headers,
             timeout=self.timeout,
         )
-        payload_raw = res.json()
+        payload_raw = _response_json(res)
         payload = payload_raw if isinstance(payload_raw, dict) else {}
         data = self._check_data(payload)
         token = data.get("token")
@@ -280,7 +491,11 @@ class FeishuClient:
 
     def upload_file(self, local_path: str, folder_token: str | None, file_name: str | None = None) -> dict[str, Any]:
         path = Path(local_path)
-        if not path.exists() or not path.is_file():
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise RuntimeError(f"local_file_not_found: {local_path}")
 
         token, token_type = self.get_access_token()
@@ -291,23 +506,33 @@ class FeishuClient:
         name = file_name or path.name
 
         headers = {"Authorization": f"Bearer {token}"}
+        data = {
+            "file_name": name,
+            "parent_type": "explorer",
+            "parent_node": parent,
+            "size": str(st.st_size),
+        }
         with path.open("rb") as fp:
-            files = {"file": (name, fp, "application/octet-stream")}
-            data = {
-                "file_name": name,
-                "parent_type": "explorer",
-                "parent_node": parent,
-                "size": str(path.stat().st_size),
-            }
-            res = requests.post(
-                f"{BASE}/drive/v1/files/upload_all",
-                headers=headers,
-                data=data,
-                files=files,
-                timeout=self.timeout,
-            )
-
-        body_raw = res.json()
+            if MultipartEncoder is not None:
+                body = MultipartEncoder(fields={**data, "file": (name, fp, "application/octet-stream")})
+                headers["Content-Type"] = body.content_type
+                headers["Content-Length"] = str(body.len)
+                res = self._session.post(
+                    self.URL_UPLOAD,
+                    headers=headers,
+                    data=body,
+                    timeout=self.timeout,
+                )
+            else:
+                res = self._session.post(
+                    self.URL_UPLOAD,
+                    headers=headers,
+                    data=data,
+                    files={"file": (name, fp, "application/octet-stream")},
+                    timeout=self.timeout,
+                )
+
+        body_raw = _response_json(res)
         body = body_raw if isinstance(body_raw, dict) else {}
         data = self._check_data(body)
         return {
@@ -318,21 +543,21 @@ class FeishuClient:
 
     def download_file(self, file_token: str, dest_path: str) -> None:
         headers, _ = self._auth_headers(content_type=None)
-        url = f"{BASE}/drive/v1/files/{file_token}/download"
-        with requests.get(url, headers=headers, timeout=self.timeout, stream=True, allow_redirects=True) as res:
+        url = f"{self.URL_FILE_PREFIX}{file_token}/download"
+        with self._session.get(url, headers=headers, timeout=self.timeout, stream=True, allow_redirects=True) as res:
             if res.status_code >= 400:
                 raise RuntimeError(f"download_failed_status_{res.status_code}")
             path = Path(dest_path)
             path.parent.mkdir(parents=True, exist_ok=True)
+            # Let urllib3 undo any Content-Encoding, then copy in 1 MiB blocks.
+            res.raw.decode_content = True
             with path.open("wb") as fp:
-                for chunk in res.iter_content(chunk_size=1024 * 64):
-                    if chunk:
-                        fp.write(chunk)
+                shutil.copyfileobj(res.raw, fp, length=1024 * 1024)
 
     def rename_file(self, file_token: str, new_name: str) -> None:
         headers, _ = self._auth_headers()
-        res = requests.patch(
-            f"{BASE}/drive/v1/files/{file_token}",
+        res = self._api.patch(
+            f"{self.URL_FILE_PREFIX}{file_token}",
             json={"name": new_name},
             headers=headers,
             timeout=self.timeout,
@@ -343,7 +568,7 @@ class FeishuClient:
         if res.status_code >= 400:
             raise RuntimeError(f"rename_failed_status_{res.status_code}: {text[:200]}")
         try:
-            payload = res.json()
+            payload = _response_json(res)
         except Exception:
             # Some gateways return empty/boolean text on success.
             if text in {"", "true", "null"}:
@@ -354,28 +579,28 @@ class FeishuClient:
     def move_file(self, file_token: str, file_type: str, folder_token: str | None) -> None:
         headers, _ = self._auth_headers()
         target = folder_token or self.get_root_folder_token()
-        res = requests.post(
-            f"{BASE}/drive/v1/files/{file_token}/move",
+        res = self._api.post(
+            f"{self.URL_FILE_PREFIX}{file_token}/move",
             json={"type": file_type or "file", "folder_token": target},
             headers=headers,
             timeout=self.timeout,
         )
-        self._check_data(res.json())
+        self._check_data(_response_json(res))
 
     def delete_file(self, file_token: str, file_type: str) -> None:
         headers, _ = self._auth_headers()
-        res = requests.delete(
-            f"{BASE}/drive/v1/files/{file_token}",
+        res = self._api.delete(
+            f"{self.URL_FILE_PREFIX}{file_token}",
             params={"type": file_type or "file"},
             headers=headers,
             timeout=self.timeout,
         )
-        self._check_data(res.json())
+        self._check_data(_response_json(res))
 
     def get_file_meta(self, file_token: str) -> dict[str, Any]:
         headers, _ = self._auth_headers()
-        res = requests.get(f"{BASE}/drive/v1/metas/{file_token}", headers=headers, timeout=self.timeout)
-        payload_raw = res.json()
+        res = self._api.get(f"{self.URL_META_PREFIX}{file_token}", headers=headers, timeout=self.timeout)
+        payload_raw = _response_json(res)
         payload = payload_raw if isinstance(payload_raw, dict) else {}
         data = self._check_data(payload)
         if "file" in data and isinstance(data["file"], dict):
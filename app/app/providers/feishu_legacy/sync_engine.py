@@ -2,12 +2,14 @@ import hashlib
 import json
 import os
 import shutil
+import sqlite3
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from .db import get_conn
+from .feishu_client import run_batch
 
 
 def sha256_file(path: Path):
@@ -200,6 +202,7 @@ class SyncEngine:
 
         self._remote_folder_cache: Dict[str, str] = {}
         self._children_folder_cache: Dict[str, Dict[str, str]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
 
     def _log(self, level: str, module: str, message: str, detail: Optional[str] = None):
         self.log_func(level, module, message, detail)
@@ -247,8 +250,22 @@ class SyncEngine:
         # When timestamps are unavailable or too close, be conservative.
         return "pull_remote"
 
-    def _db(self):
-        return get_conn(self.db_path)
+    def _db(self) -> sqlite3.Connection:
+        # One connection per engine for the whole run instead of open/close per statement.
+        conn = self._conn
+        if conn is None:
+            conn = get_conn(self.db_path)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        elif conn.in_transaction:
+            # A previous helper raised before its commit; drop its writes like close() used to.
+            conn.rollback()
+        return conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def _insert_sync_run(self, run_type: str):
         conn = self._db()
@@ -259,7 +276,6 @@ class SyncEngine:
         )
         rid = cur.lastrowid
         conn.commit()
-        conn.close()
         return rid
 
     def _finish_sync_run(self, run_id: int, status: str, summary: dict):
@@ -269,14 +285,12 @@ class SyncEngine:
             (status, now_iso(), json.dumps(summary, ensure_ascii=False), run_id),
         )
         conn.commit()
-        conn.close()
 
     def _load_mappings(self):
         conn = self._db()
         rows = conn.execute(
             "SELECT * FROM file_mappings WHERE status!='deleted' ORDER BY id"
         ).fetchall()
-        conn.close()
         return [dict(r) for r in rows]
 
     def _update_mapping(self, rel_path: str, remote_token: str, remote_type: str, local_hash: str, remote_hash: str,
@@ -338,7 +352,6 @@ class SyncEngine:
                 ),
             )
         conn.commit()
-        conn.close()
 
     def _mark_deleted_mapping(self, local_rel_path: str):
         conn = self._db()
@@ -347,7 +360,6 @@ class SyncEngine:
             (safe_rel_path(local_rel_path),),
         )
         conn.commit()
-        conn.close()
 
     def _rename_mapping_path(self, old_rel: str, new_rel: str):
         conn = self._db()
@@ -356,7 +368,6 @@ class SyncEngine:
             (safe_rel_path(new_rel), safe_rel_path(old_rel)),
         )
         conn.commit()
-        conn.close()
 
     def _insert_tombstone(self, side: str, local_rel_path: str, remote_token: str, reason: str):
         conn = self._db()
@@ -365,7 +376,6 @@ class SyncEngine:
             (side, safe_rel_path(local_rel_path) if local_rel_path else None, remote_token, reason),
         )
         conn.commit()
-        conn.close()
 
     def _enqueue_retry(self, op_type: str, payload: dict, last_error: str, attempt_count: int = 0):
         wait_sec = min(300, 2 ** min(attempt_count + 1, 8))
@@ -379,7 +389,6 @@ class SyncEngine:
             (op_type, json.dumps(payload, ensure_ascii=False), attempt_count, next_retry_at, last_error),
         )
         conn.commit()
-        conn.close()
 
     def _due_retries(self):
         conn = self._db()
@@ -392,14 +401,12 @@ class SyncEngine:
             """,
             (now_iso(),),
         ).fetchall()
-        conn.close()
         return [dict(r) for r in rows]
 
     def _retry_success(self, row_id: int):
         conn = self._db()
         conn.execute("DELETE FROM retry_queue WHERE id=?", (row_id,))
         conn.commit()
-        conn.close()
 
     def _retry_fail(self, row: dict, error: str):
         attempt = int(row.get("attempt_count", 0)) + 1
@@ -407,7 +414,6 @@ class SyncEngine:
             conn = self._db()
             conn.execute("DELETE FROM retry_queue WHERE id=?", (row["id"],))
             conn.commit()
-            conn.close()
             self._log("ERROR", "retry", "retry_discarded", json.dumps({"id": row["id"], "error": error}, ensure_ascii=False))
             return
 
@@ -423,7 +429,6 @@ class SyncEngine:
             (attempt, next_retry_at, error, row["id"]),
         )
         conn.commit()
-        conn.close()
 
     def _decode_payload_json(self, raw: Optional[str], row_id: Optional[int] = None) -> dict:
         if not raw:
@@ -526,41 +531,45 @@ class SyncEngine:
         files = []
         folders = {"": root_token}
 
-        def walk(folder_token: str, prefix: str):
-            children = self.client.list_folder_once(folder_token)
-            folder_children = {}
-            for item in children:
-                token = item.get("token")
-                if not token:
-                    continue
-                item_type = item.get("type") or "file"
-                name = item.get("name") or item.get("title") or token
-                path = f"{prefix}/{name}" if prefix else name
-
-                if item_type == "folder":
-                    folder_children[name] = token
-                    folders[path] = token
-                    if path == self.recycle_bin_name or path.startswith(f"{self.recycle_bin_name}/"):
-                        continue
-                    walk(token, path)
-                else:
-                    if path == self.recycle_bin_name or path.startswith(f"{self.recycle_bin_name}/"):
+        # Breadth-first so every folder of one level is listed concurrently.
+        level = [(root_token, "")]
+        while level:
+            listings = self.client.list_folders([folder_token for folder_token, _prefix in level])
+            next_level = []
+            for (folder_token, prefix), children in zip(level, listings):
+                folder_children = {}
+                for item in children:
+                    token = item.get("token")
+                    if not token:
                         continue
-                    files.append(
-                        {
-                            "token": token,
-                            "name": name,
-                            "type": item_type,
-                            "size": int(item.get("size") or 0),
-                            "modified_time": item.get("modified_time") or item.get("modified_at") or "",
-                            "folder_token": folder_token,
-                            "path": path,
-                        }
-                    )
+                    item_type = item.get("type") or "file"
+                    name = item.get("name") or item.get("title") or token
+                    path = f"{prefix}/{name}" if prefix else name
+
+                    if item_type == "folder":
+                        folder_children[name] = token
+                        folders[path] = token
+                        if path == self.recycle_bin_name or path.startswith(f"{self.recycle_bin_name}/"):
+                            continue
+                        next_level.append((token, path))
+                    else:
+                        if path == self.recycle_bin_name or path.startswith(f"{self.recycle_bin_name}/"):
+                            continue
+                        files.append(
+                            {
+                                "token": token,
+                                "name": name,
+                                "type": item_type,
+                                "size": int(item.get("size") or 0),
+                                "modified_time": item.get("modified_time") or item.get("modified_at") or "",
+                                "folder_token": folder_token,
+                                "path": path,
+                            }
+                        )
 
-            self._children_folder_cache[folder_token] = folder_children
+                self._children_folder_cache[folder_token] = folder_children
+            level = next_level
 
-        walk(root_token, "")
         self._remote_folder_cache = folders
         return files, folders
 
@@ -660,31 +669,27 @@ class SyncEngine:
                     continue
                 items_sorted = sorted(items, key=item_mtime, reverse=True)
                 keep = items_sorted[0]
-                for victim in items_sorted[1:]:
-                    tok = victim.get("token")
-                    typ = victim.get("type") or "file"
-                    if tok:
-                        try:
-                            self.client.delete_file(tok, typ)
-                            self._log(
-                                "WARN",
-                                "sync",
-                                "remote_dedup_deleted",
-                                json.dumps({"name": n, "token": tok, "type": typ}, ensure_ascii=False),
-                            )
-                        except Exception as e:
-                            if self._is_remote_not_found_error(e):
-                                self._log(
-                                    "WARN",
-                                    "sync",
-                                    "remote_dedup_skip_not_found",
-                                    json.dumps(
-                                        {"token": tok, "type": typ, "error": str(e)},
-                                        ensure_ascii=False,
-                                    ),
-                                )
-                                continue
-                            raise
+                victims = [(v["token"], v.get("type") or "file") for v in items_sorted[1:] if v.get("token")]
+                for (tok, typ), err in run_batch(lambda victim: self.client.delete_file(*victim), victims):
+                    if err is None:
+                        self._log(
+                            "WARN",
+                            "sync",
+                            "remote_dedup_deleted",
+                            json.dumps({"name": n, "token": tok, "type": typ}, ensure_ascii=False),
+                        )
+                    elif self._is_remote_not_found_error(err):
+                        self._log(
+                            "WARN",
+                            "sync",
+                            "remote_dedup_skip_not_found",
+                            json.dumps(
+                                {"token": tok, "type": typ, "error": str(err)},
+                                ensure_ascii=False,
+                            ),
+                        )
+                    else:
+                        raise err
 
                 # If keep is a folder, still traverse it.
                 if keep.get("type") == "folder" and keep.get("token"):
@@ -791,14 +796,28 @@ class SyncEngine:
                 return "hard_delete", 0, 0
             raise
 
+        # Plain files are leaf deletes: issue them concurrently, then recurse into sub-folders.
+        child_files = []
+        child_folders = []
         for item in children:
             child_token = item.get("token")
             if not child_token:
                 continue
-            child_type = item.get("type") or "file"
+            child_type = str(item.get("type") or "file").strip().lower() or "file"
+            if child_type == "folder":
+                child_folders.append(child_token)
+            else:
+                child_files.append((child_token, child_type))
+
+        for _child, err in run_batch(lambda child: self._hard_delete_remote(*child), child_files):
+            if err is not None:
+                raise err
+        deleted_nodes += len(child_files)
+
+        for child_token in child_folders:
             _mode, nodes, dirs = self._delete_remote_tree(
                 child_token,
-                child_type,
+                "folder",
                 root_token,
                 mode_override="hard_delete",
                 visited=seen,
@@ -1052,7 +1071,6 @@ class SyncEngine:
             ),
         )
         conn.commit()
-        conn.close()
 
     def _process_due_retries(self, root_token: str, summary: dict):
         rows = self._due_retries()
@@ -1163,9 +1181,8 @@ class SyncEngine:
             # Initial sync guard: if we have no mappings yet, pick a source-of-truth.
             # Default per config: local_wins.
             conn = self._db()
-            mapping_count = conn.execute("SELECT COUNT(1) FROM file_mappings").fetchone()[0]
-            conn.close()
-            if mapping_count == 0:
+            has_mappings = conn.execute("SELECT EXISTS(SELECT 1 FROM file_mappings)").fetchone()[0]
+            if not has_mappings:
                 if self.initial_sync_strategy == "local_wins":
                     remote_files = []
                     summary["remote_total"] = 0
@@ -1556,3 +1573,5 @@ class SyncEngine:
             self._finish_sync_run(run_id, "failed", summary)
             self._log("ERROR", "sync", "run_failed", json.dumps(summary, ensure_ascii=False))
             return summary
+        finally:
+            self.close()
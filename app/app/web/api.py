@@ -11,11 +11,16 @@ import sqlite3
 import subprocess
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, TypedDict
+from types import MappingProxyType
+from typing import Any, Mapping, TypedDict
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 from app.core.config import (
@@ -28,6 +33,9 @@ from app.core.config import (
     load_config,
     save_config,
 )
+from app.core.jsonio import dumps_bytes
+from app.core.local_watch import WATCHDOG_AVAILABLE, start_local_watcher, stop_local_watcher
+from app.core.logging_setup import LOG_LEVELS
 from app.core.log_tail import build_log_tail_payload
 from app.providers.feishu_legacy import FeishuClient, SyncEngine
 from app.providers.feishu_legacy.db import init_db
@@ -44,9 +52,21 @@ SCHEDULER_STATE_LOCK = threading.Lock()
 SCHEDULER_POLL_GRANULARITY_SEC = 1
 SCHEDULER_MIN_INTERVAL_SEC = 10
 SCHEDULER_MAX_INTERVAL_SEC = 86400
+# With watchdog installed, local edits pull the next scheduled run forward once they have
+# been quiet for this long, so bursts of saves coalesce into one sync.
+LOCAL_CHANGE_DEBOUNCE_SEC = 2
+# Status polls may be served from the browser cache within this window.
+STATUS_CACHE_CONTROL = "private, max-age=1"
+# Config changes rarely but must never be served stale after a save: always revalidate.
+CONFIG_CACHE_CONTROL = "private, no-cache"
+# Bursts of status polls share one stat of the token file within this window.
+TOKEN_FILE_EXISTS_TTL_SEC = 5
 
 _scheduler_task: asyncio.Task | None = None
 _scheduler_stop_event: asyncio.Event | None = None
+_local_change_at: float | None = None
+# Watcher events before this time are treated as the engine's own writes and ignored.
+_local_change_ignore_until = 0.0
 _scheduler_state: dict[str, object] = {
     "initialized": False,
     "running": False,
@@ -67,7 +87,8 @@ EVENT_MIN_DEBOUNCE_SEC = 0
 EVENT_MAX_DEBOUNCE_SEC = 3600
 EVENT_LOCK_WAIT_TIMEOUT_SEC = 120
 EVENT_DEDUP_TTL_SEC = 600
-EVENT_DEFAULT_TRIGGER_TYPES = [
+EVENT_DEDUP_MAX_IDS = 10000
+EVENT_DEFAULT_TRIGGER_TYPES = (
     "drive.file.edit_v1",
     "drive.file.title_updated_v1",
     "drive.file.created_in_folder_v1",
@@ -75,14 +96,15 @@ EVENT_DEFAULT_TRIGGER_TYPES = [
     "drive.file.trashed_v1",
     "drive.file.bitable_record_changed_v1",
     "drive.file.bitable_field_changed_v1",
-]
+)
 
-_event_state: dict[str, object] = {
+# Read-only initial event state; values are immutable so a shallow copy is a full reset.
+_EVENT_STATE_DEFAULTS: Mapping[str, object] = MappingProxyType({
     "enabled": False,
     "verify_token_configured": False,
     "encrypt_key_configured": False,
     "debounce_sec": 15,
-    "trigger_types": list(EVENT_DEFAULT_TRIGGER_TYPES),
+    "trigger_types": EVENT_DEFAULT_TRIGGER_TYPES,
     "pending": False,
     "last_received_at": None,
     "last_event_type": None,
@@ -100,8 +122,10 @@ _event_state: dict[str, object] = {
     "skipped_pending_count": 0,
     "skipped_disabled_count": 0,
     "duplicate_count": 0,
-}
-_event_recent_ids: dict[str, float] = {}
+})
+_event_state: dict[str, object] = dict(_EVENT_STATE_DEFAULTS)
+# Insertion order is arrival order, so expired ids are always at the front.
+_event_recent_ids: OrderedDict[str, float] = OrderedDict()
 
 
 class EventRuntimeSettings(TypedDict):
@@ -116,6 +140,15 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _etag_json_response(request: Request, payload: Any, cache_control: str) -> Response:
+    body = dumps_bytes(jsonable_encoder(payload))
+    etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 def _run_systemctl_user(args: list[str], timeout_sec: int = 4) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         ["systemctl", "--user", *args],
@@ -138,9 +171,10 @@ def _parse_systemctl_show(text: str) -> dict[str, str]:
 
 def _append_run_history(summary: dict) -> None:
     RUN_HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with RUN_HISTORY_PATH.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(summary, ensure_ascii=False))
-        f.write("\n")
+    line = dumps_bytes(summary) + b"\n"
+    # Unbuffered append: the whole line goes out in one O_APPEND write, so web and CLI runs never interleave.
+    with RUN_HISTORY_PATH.open("ab", buffering=0) as f:
+        f.write(line)
 
 
 def _read_run_history(limit: int = 50) -> list[dict]:
@@ -166,6 +200,12 @@ def _read_run_history(limit: int = 50) -> list[dict]:
     return out
 
 
+# Keyed by the file's stat so status polls re-read it only after a run rewrites it.
+@lru_cache(maxsize=2)
+def _parse_last_run_once(path: str, mtime_ns: int, size: int) -> Any:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
 def _load_latest_run_summary() -> tuple[dict[str, Any] | None, str, str | None]:
     """
     Return latest run summary with source:
@@ -174,9 +214,13 @@ def _load_latest_run_summary() -> tuple[dict[str, Any] | None, str, str | None]:
     - none: no summary available
     """
     parse_error: str | None = None
-    if LAST_RUN_ONCE_PATH.exists():
+    try:
+        st = LAST_RUN_ONCE_PATH.stat()
+    except OSError:
+        st = None
+    if st is not None:
         try:
-            payload = json.loads(LAST_RUN_ONCE_PATH.read_text(encoding="utf-8"))
+            payload = _parse_last_run_once(str(LAST_RUN_ONCE_PATH), st.st_mtime_ns, st.st_size)
             if isinstance(payload, dict):
                 return payload, "last_run_once", None
             parse_error = "last_run_once_not_object"
@@ -282,7 +326,7 @@ def _sanitize_event_debounce(raw_value: object) -> int:
 
 
 def _normalize_event_trigger_types(raw_value: object) -> list[str]:
-    if isinstance(raw_value, list):
+    if isinstance(raw_value, (list, tuple)):
         items = raw_value
     else:
         items = EVENT_DEFAULT_TRIGGER_TYPES
@@ -330,9 +374,11 @@ def _event_state_snapshot() -> dict[str, object]:
 
 
 def _event_cleanup_recent_ids(now_ts: float) -> None:
-    expired = [eid for eid, ts in _event_recent_ids.items() if now_ts - ts >= EVENT_DEDUP_TTL_SEC]
-    for eid in expired:
-        _event_recent_ids.pop(eid, None)
+    while _event_recent_ids:
+        oldest_ts = next(iter(_event_recent_ids.values()))
+        if now_ts - oldest_ts < EVENT_DEDUP_TTL_SEC and len(_event_recent_ids) < EVENT_DEDUP_MAX_IDS:
+            break
+        _event_recent_ids.popitem(last=False)
 
 
 def _event_seen_recently(event_id: str, now_ts: float) -> bool:
@@ -440,6 +486,12 @@ def _event_type_matched(event_type: str, patterns: list[str]) -> bool:
     return False
 
 
+async def _dispatch_event_sync_job(trigger_event_type: str, trigger_event_id: str, debounce_sec: int) -> None:
+    # Like the scheduler, run on the loop's executor: a sync background task would hold one of
+    # the shared AnyIO worker tokens (used by every sync endpoint) for the whole lock wait + run.
+    await asyncio.to_thread(_run_event_sync_job, trigger_event_type, trigger_event_id, debounce_sec)
+
+
 def _run_event_sync_job(trigger_event_type: str, trigger_event_id: str, debounce_sec: int) -> None:
     logger = logging.getLogger("event_callback")
     acquired = False
@@ -496,23 +548,29 @@ async def _wait_stop_or_timeout(stop_event: asyncio.Event, timeout_sec: float) -
         return False
 
 
-def _build_sync_engine():
-    cfg = load_config()
-    local_root_locked, requested_local_root = enforce_local_root_scope(cfg)
-    init_db(cfg.database.path)
-
-    client = FeishuClient(
+def _feishu_client_for(cfg) -> FeishuClient:
+    # A fresh client (own connection pool) per sync run / API request; close it when done,
+    # e.g. `with client:`.
+    return FeishuClient(
         app_id=cfg.auth.app_id,
         app_secret=cfg.auth.app_secret,
         user_token_file=cfg.auth.user_token_file,
         timeout=int(cfg.auth.timeout_sec),
     )
 
+
+def _build_sync_engine():
+    cfg = load_config()
+    local_root_locked, requested_local_root = enforce_local_root_scope(cfg)
+    init_db(cfg.database.path)
+
+    client = _feishu_client_for(cfg)
+
     def log_func(level: str, module: str, message: str, detail: str | None = None):
-        logging.getLogger(module).log(
-            getattr(logging, level.upper(), logging.INFO),
-            f"{message} {detail or ''}".strip(),
-        )
+        logger = logging.getLogger(module)
+        log_level = LOG_LEVELS.get(level.upper(), logging.INFO)
+        if logger.isEnabledFor(log_level):
+            logger.log(log_level, f"{message} {detail or ''}".strip())
 
     engine = SyncEngine(cfg.model_dump(), cfg.database.path, client, log_func)
     return cfg, engine, local_root_locked, requested_local_root
@@ -521,13 +579,7 @@ def _build_sync_engine():
 def _build_feishu_client():
     cfg = load_config()
     init_db(cfg.database.path)
-    client = FeishuClient(
-        app_id=cfg.auth.app_id,
-        app_secret=cfg.auth.app_secret,
-        user_token_file=cfg.auth.user_token_file,
-        timeout=int(cfg.auth.timeout_sec),
-    )
-    return cfg, client
+    return cfg, _feishu_client_for(cfg)
 
 
 def _event_runtime_settings(cfg) -> EventRuntimeSettings:
@@ -618,7 +670,11 @@ def _build_readiness_payload() -> dict:
 
 def _run_sync_once_and_record(run_type: str) -> dict:
     _cfg, engine, local_root_locked, locked_from = _build_sync_engine()
-    summary_raw = engine.run_once(run_type=run_type)
+    try:
+        summary_raw = engine.run_once(run_type=run_type)
+    finally:
+        engine.client.close()
+        _reset_local_change()
     summary: dict[str, object]
     if isinstance(summary_raw, dict):
         summary = dict(summary_raw)
@@ -631,15 +687,35 @@ def _run_sync_once_and_record(run_type: str) -> dict:
             "applied_local_root": FIXED_LOCAL_ROOT,
         }
     LAST_RUN_ONCE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    LAST_RUN_ONCE_PATH.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    LAST_RUN_ONCE_PATH.write_bytes(dumps_bytes(summary, indent=True))
     _append_run_history(summary)
     return summary
 
 
+def _note_local_change() -> None:
+    # Called from the watchdog observer thread; a single float store is enough.
+    global _local_change_at
+    now_ts = time.time()
+    # Every sync run holds SYNC_RUN_LOCK, so events seen meanwhile are (mostly) its own writes.
+    if SYNC_RUN_LOCK.locked() or now_ts < _local_change_ignore_until:
+        return
+    _local_change_at = now_ts
+
+
+def _reset_local_change() -> None:
+    # After any run (scheduled, manual, event): forget pending changes, and give the watcher a
+    # debounce window to flush late notifications for files the run itself wrote.
+    global _local_change_at, _local_change_ignore_until
+    _local_change_ignore_until = time.time() + LOCAL_CHANGE_DEBOUNCE_SEC
+    _local_change_at = None
+
+
 async def _scheduler_loop(stop_event: asyncio.Event) -> None:
     logger = logging.getLogger("scheduler")
     next_run_at_ts: float | None = None
     previous_effective_interval: int | None = None
+    local_watcher = None
+    local_watch_key: tuple[str, tuple[str, ...]] | None = None
     _scheduler_state_update(
         initialized=False,
         running=True,
@@ -665,18 +741,37 @@ async def _scheduler_loop(stop_event: asyncio.Event) -> None:
                 )
 
                 if not enabled:
+                    if local_watcher is not None:
+                        await asyncio.to_thread(stop_local_watcher, local_watcher)
+                        local_watcher, local_watch_key = None, None
                     next_run_at_ts = None
                     previous_effective_interval = None
                     _scheduler_state_update(next_run_at=None)
                     await _wait_stop_or_timeout(stop_event, SCHEDULER_POLL_GRANULARITY_SEC)
                     continue
 
+                if WATCHDOG_AVAILABLE:
+                    # Watch the root the engine will actually sync; follow config changes.
+                    enforce_local_root_scope(cfg)
+                    watch_key = (cfg.sync.local_root, tuple(cfg.sync.exclude_dirs))
+                    if local_watcher is None or watch_key != local_watch_key:
+                        # Stopping joins the observer and scheduling a recursive watch walks
+                        # the tree; keep both off the event loop.
+                        await asyncio.to_thread(stop_local_watcher, local_watcher)
+                        local_watcher = await asyncio.to_thread(
+                            start_local_watcher, watch_key[0], watch_key[1], _note_local_change
+                        )
+                        local_watch_key = watch_key
+
                 now_ts = time.time()
                 if next_run_at_ts is None:
                     next_run_at_ts = now_ts + effective_interval
                 elif previous_effective_interval is not None and previous_effective_interval != effective_interval:
                     next_run_at_ts = now_ts + effective_interval
                 previous_effective_interval = effective_interval
+                changed_at = _local_change_at
+                if changed_at is not None and now_ts - changed_at >= LOCAL_CHANGE_DEBOUNCE_SEC:
+                    next_run_at_ts = min(next_run_at_ts, now_ts)
                 _scheduler_state_update(next_run_at=next_run_at_ts)
 
                 wait_sec = next_run_at_ts - now_ts
@@ -744,6 +839,7 @@ async def _scheduler_loop(stop_event: asyncio.Event) -> None:
                 logger.exception("scheduler_iteration_failed: %s", e)
                 await _wait_stop_or_timeout(stop_event, SCHEDULER_POLL_GRANULARITY_SEC)
     finally:
+        stop_local_watcher(local_watcher)
         _scheduler_state_update(running=False, next_run_at=None)
         logger.info("scheduler_stopped")
 
@@ -801,11 +897,11 @@ def readyz():
 
 
 @router.get("/config")
-def get_config():
+def get_config(request: Request):
     cfg = load_config()
     event_settings = _sync_event_state_from_config(cfg)
     effective_interval = _sanitize_poll_interval(cfg.sync.poll_interval_sec)
-    return {
+    payload = {
         **cfg.model_dump(),
         "_scope": {
             "fixed_local_root": FIXED_LOCAL_ROOT,
@@ -825,6 +921,7 @@ def get_config():
             "trigger_types": list(event_settings["trigger_types"]),
         },
     }
+    return _etag_json_response(request, payload, CONFIG_CACHE_CONTROL)
 
 
 @router.post("/config")
@@ -894,7 +991,11 @@ def update_config(payload: dict):
 def drive_tree(depth: int = 4, include_recycle_bin: bool = False):
     depth = min(max(int(depth), 1), 8)
     cfg, client = _build_feishu_client()
+    with client:
+        return _drive_tree_payload(cfg, client, depth, include_recycle_bin)
+
 
+def _drive_tree_payload(cfg, client: FeishuClient, depth: int, include_recycle_bin: bool) -> dict:
     token, token_type = client.get_access_token(priority=("user", "tenant"))
     if not token:
         return {
@@ -1011,7 +1112,8 @@ def auth_url(redirect_uri: str = "https://open.feishu.cn/connect/confirm_success
     try:
         cfg, client = _build_feishu_client()
         state = secrets.token_hex(16)
-        url = client.create_oauth_authorize_url(redirect_uri=redirect_uri, state=state)
+        with client:
+            url = client.create_oauth_authorize_url(redirect_uri=redirect_uri, state=state)
         AUTH_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
         AUTH_STATE_PATH.write_text(state, encoding="utf-8")
         return {
@@ -1033,7 +1135,8 @@ def auth_exchange(payload: dict):
         if not code:
             return {"ok": False, "error": "oauth_code_missing"}
         cfg, client = _build_feishu_client()
-        token_data = client.exchange_code_for_user_token(code)
+        with client:
+            token_data = client.exchange_code_for_user_token(code)
         return {
             "ok": True,
             "saved_to": cfg.auth.user_token_file,
@@ -1052,7 +1155,8 @@ def auth_exchange(payload: dict):
 def auth_refresh(force: bool = True):
     try:
         cfg, client = _build_feishu_client()
-        token_data = client.refresh_user_access_token(force=force)
+        with client:
+            token_data = client.refresh_user_access_token(force=force)
         return {
             "ok": True,
             "saved_to": cfg.auth.user_token_file,
@@ -1068,13 +1172,21 @@ def auth_refresh(force: bool = True):
 
 
 @router.get("/logs")
-def get_logs(n: int = 200, level: str | None = None, module: str | None = None):
+def get_logs(
+    n: int = 200,
+    level: str | None = None,
+    module: str | None = None,
+    items: bool = True,
+    since: int | None = None,
+):
     cfg = load_config()
     payload = build_log_tail_payload(
         cfg.logging.file,
         n=n,
         level=level,
         module=module,
+        include_items=items,
+        since=since,
     )
     return payload
 
@@ -1100,8 +1212,7 @@ def db_summary():
         return {"path": db_path, "exists": False}
 
     con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    tables = [r[0] for r in cur.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name").fetchall()]
+    tables = [r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")]
     con.close()
     return {"path": db_path, "exists": True, "tables": tables}
 
@@ -1116,7 +1227,11 @@ def restart_service(background: BackgroundTasks):
     return {"ok": True, "message": "restarting"}
 
 
-@router.get("/status/service")
+def _status_cache_headers(response: Response) -> None:
+    response.headers["Cache-Control"] = STATUS_CACHE_CONTROL
+
+
+@router.get("/status/service", dependencies=[Depends(_status_cache_headers)])
 def service_status():
     unit = "localfile-cloudsync.service"
     out = {
@@ -1181,7 +1296,7 @@ def service_status():
     return out
 
 
-@router.get("/status/scheduler")
+@router.get("/status/scheduler", dependencies=[Depends(_status_cache_headers)])
 def scheduler_status():
     return {
         "ok": True,
@@ -1190,7 +1305,7 @@ def scheduler_status():
     }
 
 
-@router.get("/status/event-callback")
+@router.get("/status/event-callback", dependencies=[Depends(_status_cache_headers)])
 def event_callback_status():
     cfg = load_config()
     _sync_event_state_from_config(cfg)
@@ -1201,7 +1316,7 @@ def event_callback_status():
     }
 
 
-@router.get("/status/run-once")
+@router.get("/status/run-once", dependencies=[Depends(_status_cache_headers)])
 def last_run_once_status():
     summary, source, parse_error = _load_latest_run_summary()
     out: dict[str, Any] = {
@@ -1215,11 +1330,18 @@ def last_run_once_status():
     return out
 
 
-@router.get("/status/feishu")
+@lru_cache(maxsize=4)
+def _token_file_exists(user_token_file: str, ttl_bucket: int) -> bool:
+    return Path(user_token_file).expanduser().exists()
+
+
+@router.get("/status/feishu", dependencies=[Depends(_status_cache_headers)])
 def feishu_status():
     cfg = load_config()
     user_token_file = cfg.auth.user_token_file
-    token_file_path = Path(user_token_file).expanduser() if user_token_file else None
+    token_file_exists = bool(user_token_file) and _token_file_exists(
+        user_token_file, int(time.monotonic() // TOKEN_FILE_EXISTS_TTL_SEC)
+    )
 
     status: dict[str, Any] = {
         "ok": False,
@@ -1228,7 +1350,7 @@ def feishu_status():
             "app_id_configured": bool(cfg.auth.app_id),
             "app_secret_configured": bool(cfg.auth.app_secret),
             "user_token_file": user_token_file,
-            "user_token_file_exists": bool(token_file_path and token_file_path.exists()),
+            "user_token_file_exists": token_file_exists,
             "remote_folder_token_configured": bool(cfg.sync.remote_folder_token),
         },
         "token": {
@@ -1245,29 +1367,24 @@ def feishu_status():
 
     try:
         init_db(cfg.database.path)
-        client = FeishuClient(
-            app_id=cfg.auth.app_id,
-            app_secret=cfg.auth.app_secret,
-            user_token_file=cfg.auth.user_token_file,
-            timeout=int(cfg.auth.timeout_sec),
-        )
-        token, token_type = client.get_access_token(priority=("user", "tenant"))
-        status["token"]["available"] = bool(token)
-        status["token"]["type"] = token_type
+        with _feishu_client_for(cfg) as client:
+            token, token_type = client.get_access_token(priority=("user", "tenant"))
+            status["token"]["available"] = bool(token)
+            status["token"]["type"] = token_type
 
-        if not token:
-            status["token"]["error"] = "no_available_token"
-            status["connectivity"]["api_access"] = False
-            return status
+            if not token:
+                status["token"]["error"] = "no_available_token"
+                status["connectivity"]["api_access"] = False
+                return status
 
-        try:
-            root_token = cfg.sync.remote_folder_token or client.get_root_folder_token()
-            status["connectivity"]["api_access"] = True
-            status["connectivity"]["root_folder_token"] = root_token
-            status["ok"] = True
-        except Exception as e:
-            status["connectivity"]["api_access"] = False
-            status["connectivity"]["error"] = str(e)
+            try:
+                root_token = cfg.sync.remote_folder_token or client.get_root_folder_token()
+                status["connectivity"]["api_access"] = True
+                status["connectivity"]["root_folder_token"] = root_token
+                status["ok"] = True
+            except Exception as e:
+                status["connectivity"]["api_access"] = False
+                status["connectivity"]["error"] = str(e)
     except Exception as e:
         status["token"]["error"] = str(e)
         status["connectivity"]["api_access"] = False
@@ -1275,6 +1392,35 @@ def feishu_status():
     return status
 
 
+@router.get("/dashboard", dependencies=[Depends(_status_cache_headers)])
+async def dashboard_status(sections: str = ""):
+    handlers = {
+        "feishu": feishu_status,
+        "service": service_status,
+        "scheduler": scheduler_status,
+        "event_callback": event_callback_status,
+        "run_summary": last_run_once_status,
+    }
+    wanted = [name.strip() for name in sections.split(",") if name.strip()]
+    if wanted:
+        handlers = {name: fn for name, fn in handlers.items() if name in wanted}
+
+    # Sections are independent (systemctl, Feishu API, local state); run them side by side
+    # and report a failing one in place instead of failing the whole response.
+    results = await asyncio.gather(
+        *(run_in_threadpool(fn) for fn in handlers.values()),
+        return_exceptions=True,
+    )
+    out: dict[str, Any] = {"ok": True, "checked_at": _now_iso()}
+    for name, result in zip(handlers, results):
+        if isinstance(result, Exception):
+            out["ok"] = False
+            out[name] = {"ok": False, "section_failed": True, "error": str(result)}
+        else:
+            out[name] = result
+    return out
+
+
 @router.post("/events/feishu")
 async def feishu_event_callback(request: Request, background: BackgroundTasks):
     cfg = load_config()
@@ -1360,7 +1506,7 @@ async def feishu_event_callback(request: Request, background: BackgroundTasks):
         _event_state["last_result"] = "queued"
         _event_state["last_error"] = None
 
-    background.add_task(_run_event_sync_job, event_type, event_id, debounce_sec)
+    background.add_task(_dispatch_event_sync_job, event_type, event_id, debounce_sec)
     return {"msg": "success", "queued": True, "event_type": event_type, "event_id": event_id}
 
 
@@ -1396,7 +1542,7 @@ def clear_last_run():
                 normalized["error_cleared_by"] = "web_clear_last_run"
                 cleared = True
             LAST_RUN_ONCE_PATH.parent.mkdir(parents=True, exist_ok=True)
-            LAST_RUN_ONCE_PATH.write_text(json.dumps(normalized, ensure_ascii=False, indent=2), encoding="utf-8")
+            LAST_RUN_ONCE_PATH.write_bytes(dumps_bytes(normalized, indent=True))
         return {
             "ok": True,
             "cleared": cleared,
@@ -4,12 +4,21 @@ from contextlib import asynccontextmanager
 from importlib.metadata import PackageNotFoundError, version
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.core.config import load_config
 from app.providers.feishu_legacy.db import init_db
 from app.web.security import NetworkAllowlistMiddleware, get_allowed_nets
 from app.web.api import router as api_router, start_scheduler, stop_scheduler
-from app.web.pages import router as pages_router
+from app.web.pages import STATIC_DIR, ConsoleStaticFiles, router as pages_router
+
+# Console polls every 15s; keep idle connections open across polls instead of
+# uvicorn's 5s default so each poll does not reconnect.
+WEB_KEEP_ALIVE_SEC = 30
+# Log tails and tree dumps are plain text that compress ~10x; level 6 keeps
+# most of that ratio at a fraction of level 9's CPU cost on every poll.
+GZIP_MIN_SIZE = 500
+GZIP_COMPRESS_LEVEL = 6
 
 
 def _app_version() -> str:
@@ -33,8 +42,10 @@ def build_app() -> FastAPI:
 
     api = FastAPI(title="localFile_cloudSync_Server", version=_app_version(), lifespan=lifespan)
     api.add_middleware(NetworkAllowlistMiddleware, allowed_nets=get_allowed_nets())
+    api.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_COMPRESS_LEVEL)
 
     api.include_router(pages_router)
+    api.mount("/static", ConsoleStaticFiles(directory=STATIC_DIR), name="static")
 
     api.include_router(api_router)
     return api
@@ -56,6 +67,7 @@ def main():
         port=cfg.web_port,
         log_level=cfg.logging.level.lower(),
         log_config=None,
+        timeout_keep_alive=WEB_KEEP_ALIVE_SEC,
     )
 
 
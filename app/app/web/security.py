@@ -2,19 +2,43 @@ from __future__ import annotations
 
 import ipaddress
 import os
+import re
+import socket
+from functools import lru_cache
 from typing import Iterable
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import PlainTextResponse
 
+# Deny bodies are encoded once. Each rejection still gets its own response object:
+# outer middleware (e.g. GZip) edits the response's raw header list in place.
+_DENY_UNKNOWN_BODY = "访问被拒绝：来源地址无法识别".encode("utf-8")
+_DENY_SCOPE_BODY = "访问被拒绝：当前地址不在允许网段内".encode("utf-8")
 
-def _parse_nets(raw: str) -> list[ipaddress._BaseNetwork]:
+
+# Plain dotted-quad IPv4 (optionally /prefix) without leading zeros; anything else,
+# including IPv6, goes through ipaddress.ip_network.
+_IPV4_CIDR_RE = re.compile(r"^((?:0|[1-9]\d{0,2})(?:\.(?:0|[1-9]\d{0,2})){3})(?:/(\d{1,2}))?$")
+
+
+def _parse_nets(raw: Iterable[str]) -> list[ipaddress._BaseNetwork]:
     nets: list[ipaddress._BaseNetwork] = []
-    for part in (raw or "").split(","):
+    for part in raw:
         s = part.strip()
         if not s:
             continue
+        m = _IPV4_CIDR_RE.match(s)
+        if m:
+            prefix = int(m.group(2) or 32)
+            if prefix <= 32:
+                try:
+                    packed = socket.inet_aton(m.group(1))
+                except OSError:
+                    packed = None
+                if packed is not None:
+                    nets.append(ipaddress.IPv4Network((int.from_bytes(packed, "big"), prefix), strict=False))
+                    continue
         try:
             nets.append(ipaddress.ip_network(s, strict=False))
         except ValueError as exc:
@@ -22,37 +46,80 @@ def _parse_nets(raw: str) -> list[ipaddress._BaseNetwork]:
     return nets
 
 
+# Requests come from a handful of recurring hosts; parse each address string once.
+@lru_cache(maxsize=4096)
+def _parse_client(host: str) -> tuple[int, int] | None:
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        return None
+    return ip.version, int(ip)
+
+
+def _mask_buckets(nets: Iterable[ipaddress.IPv4Network | ipaddress.IPv6Network]) -> list[tuple[int, frozenset[int]]]:
+    buckets: dict[int, set[int]] = {}
+    for net in nets:
+        buckets.setdefault(int(net.netmask), set()).add(int(net.network_address))
+    return [(mask, frozenset(buckets[mask])) for mask in sorted(buckets)]
+
+
 class NetworkAllowlistMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, allowed_nets: Iterable[str]):
         super().__init__(app)
         self.allowed: list[ipaddress._BaseNetwork] = []
         self.allowlist_error: str | None = None
         try:
-            self.allowed = _parse_nets(",".join(allowed_nets))
+            self.allowed = _parse_nets(allowed_nets)
         except ValueError as exc:
             self.allowlist_error = str(exc)
+        self._deny_503_body = (
+            f"访问被拒绝：允许网段配置错误（{self.allowlist_error}）".encode("utf-8") if self.allowlist_error else b""
+        )
+        # Per IP version, one (netmask, {network ints}) bucket per distinct prefix length:
+        # a request check masks the address once per bucket and does a set lookup, so the
+        # cost is bounded by the number of prefix lengths, not the number of networks.
+        # Overlapping entries are collapsed and the broadest buckets come first.
+        v4 = [net for net in self.allowed if isinstance(net, ipaddress.IPv4Network)]
+        v6 = [net for net in self.allowed if isinstance(net, ipaddress.IPv6Network)]
+        self._masks: dict[int, list[tuple[int, frozenset[int]]]] = {
+            4: _mask_buckets(ipaddress.collapse_addresses(v4)),
+            6: _mask_buckets(ipaddress.collapse_addresses(v6)),
+        }
+        # Fast paths for the common configs: a /0 opens a whole IP version, and the
+        # default single-host allowlist (127.0.0.1/32) is matched on the raw host string.
+        self._open_versions = frozenset(net.version for net in self.allowed if net.prefixlen == 0)
+        self._single_host: str | None = None
+        if len(self.allowed) == 1 and self.allowed[0].num_addresses == 1:
+            self._single_host = str(self.allowed[0].network_address)
 
     async def dispatch(self, request: Request, call_next):
         if self.allowlist_error:
-            return PlainTextResponse(
-                f"访问被拒绝：允许网段配置错误（{self.allowlist_error}）",
-                status_code=503,
-            )
+            return PlainTextResponse(self._deny_503_body, status_code=503)
 
         client_host = request.client.host if request.client else ""
-        try:
-            ip = ipaddress.ip_address(client_host)
-        except Exception:
-            return PlainTextResponse("访问被拒绝：来源地址无法识别", status_code=403)
+        if not client_host:
+            return PlainTextResponse(_DENY_UNKNOWN_BODY, status_code=403)
+        if client_host == self._single_host:
+            return await call_next(request)
+
+        parsed = _parse_client(client_host)
+        if parsed is None:
+            return PlainTextResponse(_DENY_UNKNOWN_BODY, status_code=403)
 
-        if self.allowed:
-            ok = any(ip in net for net in self.allowed)
+        version, ip_int = parsed
+        if self.allowed and version not in self._open_versions:
+            ok = any((ip_int & mask) in networks for mask, networks in self._masks[version])
             if not ok:
-                return PlainTextResponse("访问被拒绝：当前地址不在允许网段内", status_code=403)
+                return PlainTextResponse(_DENY_SCOPE_BODY, status_code=403)
 
         return await call_next(request)
 
 
+# Keyed on the raw env value, so a changed ALLOWED_NETS (e.g. under monkeypatch) is re-split.
+@lru_cache(maxsize=4)
+def _split_allowed_nets(raw: str) -> tuple[str, ...]:
+    return tuple(s.strip() for s in raw.split(",") if s.strip())
+
+
 def get_allowed_nets() -> list[str]:
-    raw = os.environ.get("ALLOWED_NETS", "127.0.0.1/32")
-    return [s.strip() for s in raw.split(",") if s.strip()]
+    return list(_split_allowed_nets(os.environ.get("ALLOWED_NETS", "127.0.0.1/32")))
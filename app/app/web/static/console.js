@@ -0,0 +1,1636 @@
+const RUN_ONCE_REQUEST_TIMEOUT_MS = 180000;
+let autoSyncEnabled = false;
+let autoSyncKnown = false;
+let schedulerInitialized = false;
+let autoSyncLastResult = "";
+let autoSyncNextRunInSec = null;
+let autoSyncNextRunAtMs = null;
+let autoSyncTicker = null;
+const _idCache = Object.create(null);
+const firstLoadPending = {
+  config: true,
+  tree: true,
+  feishu: true,
+  scheduler: true,
+  eventCallback: true,
+  service: true,
+  runSummary: true,
+  logs: true,
+};
+
+function $id(id) {
+  let el = _idCache[id];
+  if (!el || !el.isConnected) {
+    el = document.getElementById(id);
+    _idCache[id] = el;
+  }
+  return el;
+}
+
+function asText(value, fallback = "-") {
+  // Called for every table cell and tree row: no arguments object, and strings skip String().
+  if (value === null || value === undefined) return fallback;
+  const s = (typeof value === "string" ? value : String(value)).trim();
+  return s || fallback;
+}
+
+const inflight = new Map();
+
+function once(key, fn) {
+  // Concurrent callers of the same refresh share one in-flight request.
+  const pending = inflight.get(key);
+  if (pending) return pending;
+  const next = Promise.resolve().then(fn).finally(() => inflight.delete(key));
+  inflight.set(key, next);
+  return next;
+}
+
+function consumeFirstLoad(key) {
+  const first = !!firstLoadPending[key];
+  firstLoadPending[key] = false;
+  return first;
+}
+
+function asYesNo(value) {
+  if (value === null || value === undefined) return "未知";
+  return value ? "是" : "否";
+}
+
+const HTML_ESCAPES = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" };
+const _escapeCache = new Map();
+
+function escapeHtml(value) {
+  const s = String(value);
+  let escaped = _escapeCache.get(s);
+  if (escaped !== undefined) return escaped;
+  escaped = s.replace(/[&<>"']/g, (ch) => HTML_ESCAPES[ch]);
+  if (_escapeCache.size >= 512) _escapeCache.clear();
+  _escapeCache.set(s, escaped);
+  return escaped;
+}
+
+function toLocalTime(value) {
+  if (!value) return "-";
+  try {
+    return new Date(value).toLocaleString("zh-CN", { hour12: false });
+  } catch (_e) {
+    return String(value);
+  }
+}
+
+function bytes(v) {
+  const n = Number(v || 0);
+  if (!Number.isFinite(n) || n <= 0) return "0 B";
+  if (n < 1024) return n + " B";
+  if (n < 1024 * 1024) return (n / 1024).toFixed(1) + " KB";
+  if (n < 1024 * 1024 * 1024) return (n / (1024 * 1024)).toFixed(1) + " MB";
+  return (n / (1024 * 1024 * 1024)).toFixed(1) + " GB";
+}
+
+const _tErrCache = new Map();
+
+function tErr(raw) {
+  const s = asText(raw, "");
+  if (!s) return "无";
+  // The same few backend error strings recur on every failed poll; skip the substring scans.
+  let text = _tErrCache.get(s);
+  if (text !== undefined) return text;
+  text = s;
+  if (s.indexOf("no_available_token") >= 0 || s.indexOf("no_token") >= 0) text = "没有可用令牌，请先完成 app_id/app_secret 与授权。";
+  else if (s.indexOf("oauth_code_missing") >= 0) text = "缺少授权 code。";
+  else if (s.indexOf("auth_incomplete") >= 0) text = "应用凭证不完整，请检查 app_id 与 app_secret。";
+  else if (s.indexOf("invalid_config") >= 0) text = "配置格式不合法，请检查端口和自动同步间隔。";
+  else if (s.indexOf("sync_busy") >= 0) text = "同步任务正在执行中，请稍后重试。";
+  else if (s.indexOf("feishu_error") >= 0) text = "飞书 OpenAPI 返回错误，请检查权限范围。";
+  else if (s.indexOf("Failed to fetch") >= 0) text = "请求失败，请确认服务已启动。";
+  else if (s.indexOf("timed out") >= 0 || s.indexOf("timeout") >= 0) text = "请求超时，请稍后重试。";
+  if (_tErrCache.size >= 256) _tErrCache.clear();
+  _tErrCache.set(s, text);
+  return text;
+}
+
+const uiWrites = new Map();
+let uiFrame = null;
+
+function queueUiWrite(key, write) {
+  // A burst of status setters lands in one frame; the last write per target wins.
+  uiWrites.delete(key);
+  uiWrites.set(key, write);
+  if (uiFrame === null) uiFrame = window.requestAnimationFrame(flushUiWrites);
+}
+
+function flushUiWrites() {
+  uiFrame = null;
+  const writes = Array.from(uiWrites.values());
+  uiWrites.clear();
+  for (const write of writes) write();
+}
+
+function setMsg(text, level) {
+  const write = () => {
+    const node = $id("globalMsg");
+    node.textContent = text;
+    node.className = "global-msg " + (level || "info");
+  };
+  if (level === "danger") {
+    // Errors show immediately, and must not be overwritten by an older queued message.
+    uiWrites.delete("globalMsg");
+    write();
+    return;
+  }
+  queueUiWrite("globalMsg", write);
+}
+
+function nowClock() {
+  return new Date().toLocaleTimeString("zh-CN", { hour12: false });
+}
+
+function setActionState(nodeId, text, tone) {
+  queueUiWrite(nodeId, () => {
+    const node = $id(nodeId);
+    if (!node) return;
+    node.textContent = text;
+    node.className = "action-state" + (tone ? (" " + tone) : "");
+  });
+}
+
+function setTopStat(nodeId, text, tone) {
+  queueUiWrite(nodeId, () => {
+    const node = $id(nodeId);
+    if (!node) return;
+    node.textContent = text;
+    node.className = "stat-value" + (tone ? (" " + tone) : "");
+  });
+}
+
+const _shortTokenCache = new Map();
+
+function shortToken(value, left, right) {
+  const s = asText(value, "-");
+  const l = Number(left || 7);
+  const r = Number(right || 5);
+  if (s === "-" || s.length <= l + r + 3) return s;
+  const key = l + ":" + r + ":" + s;
+  let short = _shortTokenCache.get(key);
+  if (short === undefined) {
+    short = s.slice(0, l) + "..." + s.slice(-r);
+    if (_shortTokenCache.size >= 256) _shortTokenCache.clear();
+    _shortTokenCache.set(key, short);
+  }
+  return short;
+}
+
+function setFeishuLamp(mode, title, detail) {
+  const safeMode = ["loading", "ok", "warn", "bad"].includes(mode) ? mode : "loading";
+  queueUiWrite("feishuLamp", () => {
+    const dot = $id("feishuLampDot");
+    const topDot = $id("topFeishuDot");
+    const titleNode = $id("feishuLampTitle");
+    const detailNode = $id("feishuLampDetail");
+    dot.className = "pulse-dot " + safeMode;
+    if (topDot) topDot.className = "pulse-dot micro " + safeMode;
+    titleNode.textContent = title || "连接检测中";
+    detailNode.textContent = detail || "";
+  });
+}
+
+async function withButtonLoading(btnId, pendingText, fn) {
+  const btn = $id(btnId);
+  if (!btn) return fn();
+  const origin = btn.dataset.originText || btn.textContent;
+  if (!btn.dataset.originText) btn.dataset.originText = origin;
+  btn.disabled = true;
+  btn.classList.add("btn-loading");
+  btn.textContent = pendingText || "处理中...";
+  try {
+    return await fn();
+  } finally {
+    btn.disabled = false;
+    btn.classList.remove("btn-loading");
+    btn.textContent = btn.dataset.originText || origin;
+  }
+}
+
+function bindButtonAction(btnId, pendingText, fn) {
+  const btn = $id(btnId);
+  if (!btn) return;
+  btn.addEventListener("click", (event) => {
+    event.preventDefault();
+    withButtonLoading(btnId, pendingText, fn).catch((err) => {
+      setMsg("操作失败：" + tErr(err?.message ? err.message : err), "danger");
+    });
+  });
+}
+
+// Constant placeholder rows shared by every table instead of rebuilt per failed poll.
+const ROWS_RETRYING = Object.freeze([Object.freeze(["状态", "获取中，稍后自动重试", "value-warn"])]);
+const ROW_READ_FAILED = Object.freeze(["状态", "读取失败", "value-bad"]);
+const pendingRows = Object.create(null);
+
+function renderRows(tableId, rows) {
+  // Tables in inactive panels keep only the latest rows; activateTab renders them.
+  const panel = $id(tableId).closest(".panel");
+  if (panel && !panel.classList.contains("active")) {
+    pendingRows[tableId] = rows;
+    return;
+  }
+  delete pendingRows[tableId];
+  writeRows(tableId, rows);
+}
+
+function flushPendingRows(panel) {
+  for (const tableId of Object.keys(pendingRows)) {
+    if ($id(tableId).closest(".panel") !== panel) continue;
+    const rows = pendingRows[tableId];
+    delete pendingRows[tableId];
+    writeRows(tableId, rows);
+  }
+}
+
+// Row labels and tone classes come from a small fixed vocabulary, so the escaped
+// "<tr><th>label</th><td class=...>" prefix is built once per pair.
+const _rowHeadCache = new Map();
+
+function rowHead(key, cls) {
+  const cacheKey = key + "\u0000" + (cls || "");
+  let head = _rowHeadCache.get(cacheKey);
+  if (head === undefined) {
+    head = "<tr><th>" + escapeHtml(asText(key)) + "</th><td" + (cls ? " class='" + escapeHtml(cls) + "'" : "") + ">";
+    if (_rowHeadCache.size >= 256) _rowHeadCache.clear();
+    _rowHeadCache.set(cacheKey, head);
+  }
+  return head;
+}
+
+function writeRows(tableId, rows) {
+  const tbody = document.querySelector("#" + tableId + " tbody");
+  let html = "";
+  for (const [key, value, cls] of rows) {
+    html += rowHead(key, cls) + escapeHtml(asText(value)) + "</td></tr>";
+  }
+  // Idle polls usually return the same rows; skip the tbody rebuild when nothing changed.
+  if (tbody._renderedHtml === html) return;
+  tbody._renderedHtml = html;
+  tbody.innerHTML = html;
+}
+
+// Large JSON bodies (the Drive tree) are decoded and parsed in a worker so the
+// main thread keeps ticking; small responses are not worth the round trip.
+const WORKER_PARSE_MIN_BYTES = 64 * 1024;
+const JSON_WORKER_SOURCE = "onmessage = (e) => { let msg; try { msg = { id: e.data.id, data: JSON.parse(new TextDecoder().decode(e.data.buffer)) }; } catch (err) { msg = { id: e.data.id, error: String(err) }; } postMessage(msg); };";
+const jsonWorkerPending = new Map();
+let jsonWorker = null;
+let jsonWorkerSeq = 0;
+
+function parseJsonInWorker(buffer) {
+  if (typeof Worker === "undefined") return Promise.resolve(JSON.parse(new TextDecoder().decode(buffer)));
+  if (jsonWorker === null) {
+    jsonWorker = new Worker(URL.createObjectURL(new Blob([JSON_WORKER_SOURCE], { type: "text/javascript" })));
+    jsonWorker.onmessage = (event) => {
+      const entry = jsonWorkerPending.get(event.data.id);
+      if (!entry) return;
+      jsonWorkerPending.delete(event.data.id);
+      if (event.data.error !== undefined) entry.reject(new Error(event.data.error));
+      else entry.resolve(event.data.data);
+    };
+  }
+  const id = ++jsonWorkerSeq;
+  return new Promise((resolve, reject) => {
+    jsonWorkerPending.set(id, { resolve: resolve, reject: reject });
+    jsonWorker.postMessage({ id: id, buffer: buffer }, [buffer]);
+  });
+}
+
+// GET responses that carry an ETag are kept per URL and revalidated with If-None-Match;
+// any write clears them since it may change what they describe.
+const etagCache = new Map();
+
+async function api(method, url, payload, requestOptions) {
+  const options = {
+    method: method || "GET",
+    headers: {},
+    credentials: "same-origin",
+    cache: payload !== undefined ? "no-store" : "default",
+  };
+  if (requestOptions?.priority) options.priority = requestOptions.priority;
+  const isGet = options.method === "GET";
+  if (!isGet) etagCache.clear();
+  const cached = isGet ? etagCache.get(url) : undefined;
+  if (cached) options.headers["If-None-Match"] = cached.etag;
+  if (payload !== undefined) {
+    options.headers["Content-Type"] = "application/json";
+    options.body = JSON.stringify(payload);
+  }
+
+  const timeoutRaw = requestOptions?.timeoutMs;
+  const timeoutMs = Number.isFinite(Number(timeoutRaw)) ? Math.max(0, Number(timeoutRaw)) : 60000;
+  const controller = new AbortController();
+  options.signal = controller.signal;
+  const timeoutId = timeoutMs > 0 ? window.setTimeout(() => controller.abort(), timeoutMs) : null;
+
+  let resp;
+  try {
+    resp = await fetch(url, options);
+  } catch (err) {
+    if (timeoutId !== null) window.clearTimeout(timeoutId);
+    if (err?.name === "AbortError") {
+      throw new Error("request_timeout");
+    }
+    throw err;
+  }
+  if (timeoutId !== null) window.clearTimeout(timeoutId);
+  if (resp.status === 304 && cached) return cached.data;
+
+  if (requestOptions?.parseInWorker && resp.ok) {
+    // Decide on the decoded size: with gzip, Content-Length is only the compressed size.
+    const buffer = await resp.arrayBuffer();
+    if (buffer.byteLength >= WORKER_PARSE_MIN_BYTES) return parseJsonInWorker(buffer);
+    return buffer.byteLength > 0 ? JSON.parse(new TextDecoder().decode(buffer)) : {};
+  }
+
+  const size = Number(resp.headers.get("Content-Length") || NaN);
+
+  let data = {};
+  const contentType = resp.headers.get("Content-Type") || "";
+  if (contentType.includes("application/json") && size !== 0) {
+    // Let the browser parse straight from the body stream instead of via an intermediate string.
+    try { data = await resp.json(); }
+    catch (_e) { data = { raw: "invalid_json_response" }; }
+  } else {
+    const raw = await resp.text();
+    if (raw) {
+      try { data = JSON.parse(raw); }
+      catch (_e) { data = { raw: raw }; }
+    }
+  }
+  if (!resp.ok) {
+    throw new Error(data.detail || data.error || data.raw || ("HTTP " + resp.status));
+  }
+  const etag = isGet ? resp.headers.get("ETag") : null;
+  if (etag) etagCache.set(url, { etag: etag, data: data });
+  return data;
+}
+
+function activateTab(name) {
+  document.querySelectorAll(".tab").forEach((tab) => {
+    tab.classList.toggle("active", tab.dataset.tab === name);
+  });
+  document.querySelectorAll(".panel").forEach((panel) => {
+    panel.classList.toggle("active", panel.id === ("panel-" + name));
+  });
+  const panel = $id("panel-" + name);
+  if (panel) flushPendingRows(panel);
+}
+
+function setRunBadge(state, text) {
+  const badge = $id("runBadge");
+  const label = $id("runBadgeText");
+  badge.className = "badge " + state;
+  if (state === "loading") badge.textContent = "获取中";
+  else if (state === "running") badge.textContent = "执行中";
+  else if (state === "success") badge.textContent = "成功";
+  else if (state === "failed") badge.textContent = "失败";
+  else badge.textContent = "空闲";
+  label.textContent = text || "";
+}
+
+function renderScopeBanner(outOfScope, fixedRoot) {
+  // The page ships the in-scope banner; swap it once the config says otherwise.
+  const banner = $id("scopeBanner");
+  const state = (outOfScope ? "warn:" : "info:") + fixedRoot;
+  if (banner._state === state) return;
+  banner._state = state;
+  banner.className = "banner " + (outOfScope ? "warn" : "info");
+  banner.innerHTML = outOfScope
+    ? "检测到 <code>sync.local_root</code> 不在允许范围，运行时将锁定为 <code>" + escapeHtml(fixedRoot) + "</code>"
+    : "本地同步目录策略：固定锁定 <code>" + escapeHtml(fixedRoot) + "</code>";
+}
+
+async function refreshConfigView(options) {
+  const silentState = !!options?.silentState;
+  const firstLoad = consumeFirstLoad("config");
+  if (!silentState) setActionState("configState", "正在读取当前配置...", "loading");
+  try {
+    const data = await api("GET", "/api/config");
+    const scope = data._scope || {};
+    const out = !!scope.out_of_scope;
+    renderScopeBanner(out, asText(scope.fixed_local_root, ""));
+
+    $id("fAppId").value = asText(data.auth?.app_id, "");
+    $id("fAppSecret").value = asText(data.auth?.app_secret, "");
+    $id("fUserTokenFile").value = asText(data.auth?.user_token_file, "");
+    $id("fWebHost").value = asText(data.web_bind_host, "127.0.0.1");
+    $id("fWebPort").value = asText(data.web_port, "8765");
+    const pollIntervalValue = asText(data.sync?.poll_interval_sec, "300");
+    $id("fPollIntervalSec").value = pollIntervalValue;
+    const preset = $id("fPollIntervalPreset");
+    if (Array.from(preset.options).some((opt) => opt.value === pollIntervalValue)) preset.value = pollIntervalValue;
+    else preset.value = "";
+    $id("fRemoteFolderToken").value = asText(data.sync?.remote_folder_token, "");
+    $id("fRemoteDeleteMode").value = asText(data.sync?.remote_delete_mode, "recycle_bin");
+    $id("fCleanupEmptyRemoteDirs").checked = !!data.sync?.cleanup_empty_remote_dirs;
+    $id("fCleanupRemoteMissingDirsRecursive").checked = !!data.sync?.cleanup_remote_missing_dirs_recursive;
+    $id("fEventCallbackEnabled").checked = !!data.sync?.event_callback_enabled;
+    $id("fEventVerifyToken").value = asText(data.sync?.event_verify_token, "");
+    $id("fEventEncryptKey").value = asText(data.sync?.event_encrypt_key, "");
+    $id("fEventDebounceSec").value = asText(data.sync?.event_debounce_sec, "15");
+    const eventTriggerTypes = Array.isArray(data.sync?.event_trigger_types)
+      ? data.sync.event_trigger_types.map((v) => asText(v, "")).filter((v) => !!v)
+      : [];
+    $id("fEventTriggerTypes").value = eventTriggerTypes.join("\n");
+
+    const schedulerMeta = data._scheduler || {};
+    const configuredInterval = Number(data.sync?.poll_interval_sec || 0);
+    const effectiveInterval = Number(schedulerMeta.effective_poll_interval_sec || configuredInterval || 0);
+    const rows = [
+      ["固定本地根目录", asText(scope.fixed_local_root), "value-good"],
+      ["配置中的 local_root", asText(scope.configured_local_root), out ? "value-warn" : ""],
+      ["out_of_scope", out ? "是" : "否", out ? "value-warn" : "value-good"],
+      ["auth.app_id", asText(data.auth?.app_id), data.auth?.app_id ? "value-good" : "value-bad"],
+      ["auth.app_secret", data.auth?.app_secret ? "已配置（隐藏）" : "未配置", data.auth?.app_secret ? "value-good" : "value-bad"],
+      ["auth.user_token_file", asText(data.auth?.user_token_file), ""],
+      ["sync.remote_folder_token", asText(data.sync?.remote_folder_token, "未配置（默认 Drive 根目录）"), ""],
+      ["sync.default_sync_direction", asText(data.sync?.default_sync_direction, "remote_wins"), ""],
+      ["sync.remote_delete_mode", asText(data.sync?.remote_delete_mode, "recycle_bin"), asText(data.sync?.remote_delete_mode, "recycle_bin") === "hard_delete" ? "value-warn" : ""],
+      ["sync.cleanup_empty_remote_dirs", asYesNo(data.sync?.cleanup_empty_remote_dirs), data.sync?.cleanup_empty_remote_dirs ? "value-warn" : ""],
+      ["sync.cleanup_remote_missing_dirs_recursive", asYesNo(data.sync?.cleanup_remote_missing_dirs_recursive), data.sync?.cleanup_remote_missing_dirs_recursive ? "value-warn" : ""],
+      ["sync.event_callback_enabled", asYesNo(data.sync?.event_callback_enabled), data.sync?.event_callback_enabled ? "value-good" : "value-warn"],
+      ["sync.event_verify_token", data.sync?.event_verify_token ? "已配置（隐藏）" : "未配置", data.sync?.event_verify_token ? "value-good" : "value-warn"],
+      ["sync.event_encrypt_key", data.sync?.event_encrypt_key ? "已配置（隐藏）" : "未配置", data.sync?.event_encrypt_key ? "value-good" : ""],
+      ["sync.event_debounce_sec", asText(data.sync?.event_debounce_sec, "15"), ""],
+      ["sync.event_trigger_types", eventTriggerTypes.length > 0 ? eventTriggerTypes.join(", ") : "(默认)", ""],
+      ["sync.remote_recycle_bin", asText(data.sync?.remote_recycle_bin, "SyncRecycleBin"), ""],
+      ["sync.auto_sync_enabled", configuredInterval > 0 ? "是" : "否", configuredInterval > 0 ? "value-good" : "value-warn"],
+      ["sync.poll_interval_sec", asText(configuredInterval), configuredInterval > 0 ? "" : "value-warn"],
+      ["sync.poll_interval_effective_sec", asText(effectiveInterval), (configuredInterval > 0 && effectiveInterval !== configuredInterval) ? "value-warn" : ""],
+      ["web_bind_host:web_port", asText(data.web_bind_host) + ":" + asText(data.web_port), ""],
+      ["database.path", asText(data.database?.path), ""],
+      ["logging.file", asText(data.logging?.file), ""]
+    ];
+    renderRows("configTable", rows);
+    if (!silentState) setActionState("configState", "当前配置已刷新（" + nowClock() + "）", "success");
+    return true;
+  } catch (err) {
+    if (firstLoad) {
+      renderRows("configTable", ROWS_RETRYING);
+      if (!silentState) setActionState("configState", "当前配置获取中，稍后自动重试...", "loading");
+      return true;
+    }
+    renderRows("configTable", [
+      ROW_READ_FAILED,
+      ["错误", tErr(err.message), "value-bad"]
+    ]);
+    if (!silentState) setActionState("configState", "读取配置失败：" + tErr(err.message), "danger");
+    setMsg("读取配置失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+async function saveConfig() {
+  setActionState("configState", "正在保存基础配置...", "loading");
+  const pollIntervalRaw = $id("fPollIntervalSec").value.trim();
+  const pollInterval = Number(pollIntervalRaw || "300");
+  if (!Number.isFinite(pollInterval) || pollInterval < 0) {
+    setActionState("configState", "自动同步间隔必须是大于等于 0 的数字。", "warn");
+    setMsg("自动同步间隔必须是大于等于 0 的数字。", "warn");
+    return false;
+  }
+  const eventDebounceRaw = $id("fEventDebounceSec").value.trim();
+  const eventDebounce = Number(eventDebounceRaw || "15");
+  if (!Number.isFinite(eventDebounce) || eventDebounce < 0) {
+    setActionState("configState", "事件去抖秒数必须是大于等于 0 的数字。", "warn");
+    setMsg("事件去抖秒数必须是大于等于 0 的数字。", "warn");
+    return false;
+  }
+  const eventTriggerTypes = $id("fEventTriggerTypes").value
+    .split(/\r?\n/)
+    .map((line) => line.trim())
+    .filter((line) => !!line);
+  const payload = {
+    auth: {
+      app_id: $id("fAppId").value.trim(),
+      app_secret: $id("fAppSecret").value.trim(),
+      user_token_file: $id("fUserTokenFile").value.trim()
+    },
+    sync: {
+      remote_folder_token: $id("fRemoteFolderToken").value.trim(),
+      poll_interval_sec: Math.floor(pollInterval),
+      remote_delete_mode: $id("fRemoteDeleteMode").value,
+      cleanup_empty_remote_dirs: !!$id("fCleanupEmptyRemoteDirs").checked,
+      cleanup_remote_missing_dirs_recursive: !!$id("fCleanupRemoteMissingDirsRecursive").checked,
+      event_callback_enabled: !!$id("fEventCallbackEnabled").checked,
+      event_verify_token: $id("fEventVerifyToken").value.trim(),
+      event_encrypt_key: $id("fEventEncryptKey").value.trim(),
+      event_debounce_sec: Math.floor(eventDebounce),
+      event_trigger_types: eventTriggerTypes
+    },
+    web_bind_host: $id("fWebHost").value.trim(),
+    web_port: Number($id("fWebPort").value.trim() || "8765")
+  };
+  try {
+    const result = await api("POST", "/api/config", payload);
+    if (result.warnings?.length > 0) {
+      setMsg("配置已保存，local_root 超范围时会自动锁定。", "warn");
+      setActionState("configState", "配置已保存（含提示，" + nowClock() + "）", "warn");
+    } else {
+      setMsg("配置已保存。", "success");
+      setActionState("configState", "配置保存成功（" + nowClock() + "）", "success");
+    }
+    await refreshConfigView({ silentState: true });
+    await settleAll([refreshFeishu(), refreshScheduler()]);
+    return true;
+  } catch (err) {
+    setActionState("configState", "保存配置失败：" + tErr(err.message), "danger");
+    setMsg("保存配置失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+async function genAuthUrl() {
+  setActionState("configState", "正在生成授权链接...", "loading");
+  const redirectUri = $id("fRedirectUri").value.trim();
+  if (!redirectUri) {
+    setActionState("configState", "请先填写 redirect_uri。", "warn");
+    setMsg("请先填写 redirect_uri。", "warn");
+    return false;
+  }
+  try {
+    const data = await api("GET", "/api/auth/url?redirect_uri=" + encodeURIComponent(redirectUri));
+    if (!data.ok) throw new Error(data.error || "生成授权链接失败");
+    $id("authUrlBox").value = asText(data.auth_url, "");
+    setActionState("configState", "授权链接已生成（" + nowClock() + "）", "success");
+    setMsg("授权链接已生成，请在浏览器打开并完成授权。", "success");
+    return true;
+  } catch (err) {
+    setActionState("configState", "生成授权链接失败：" + tErr(err.message), "danger");
+    setMsg("生成授权链接失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+async function exchangeCode() {
+  setActionState("configState", "正在提交授权 code...", "loading");
+  const code = $id("fAuthCode").value.trim();
+  if (!code) {
+    setActionState("configState", "请先填写授权 code。", "warn");
+    setMsg("请填写授权 code。", "warn");
+    return false;
+  }
+  try {
+    const data = await api("POST", "/api/auth/exchange", { code: code });
+    if (!data.ok) throw new Error(data.error || "交换失败");
+    $id("fAuthCode").value = "";
+    setActionState("configState", "授权 code 交换成功（" + nowClock() + "）", "success");
+    setMsg("code 交换成功，token_type=" + asText(data.token_type) + " expires_in=" + asText(data.expires_in), "success");
+    await refreshFeishu();
+    return true;
+  } catch (err) {
+    setActionState("configState", "code 交换失败：" + tErr(err.message), "danger");
+    setMsg("code 交换失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+async function refreshToken() {
+  setActionState("configState", "正在刷新 user_access_token...", "loading");
+  try {
+    const data = await api("POST", "/api/auth/refresh?force=true", {});
+    if (!data.ok) throw new Error(data.error || "刷新失败");
+    setActionState("configState", "user_access_token 刷新成功（" + nowClock() + "）", "success");
+    setMsg("user_access_token 已刷新。expires_in=" + asText(data.expires_in), "success");
+    await refreshFeishu();
+    return true;
+  } catch (err) {
+    setActionState("configState", "刷新 user_access_token 失败：" + tErr(err.message), "danger");
+    setMsg("刷新 user_access_token 失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+let treeIndex = new Map();
+
+function setTextIfChanged(node, text) {
+  if (node.textContent !== text) node.textContent = text;
+}
+
+function treeNodeKey(node) {
+  return asText(node.token, "") || ("path:" + asText(node.path, ""));
+}
+
+function treeNameText(node, isRoot) {
+  return isRoot ? "/ " + asText(node.name, "drive_root") : asText(node.name, "(unnamed)");
+}
+
+function treeMetaText(node, isFolder, children) {
+  if (isFolder) {
+    return "子项 " + children.length + (node.truncated ? " · 深度已截断" : "") + " · ID " + shortToken(node.token, 6, 4);
+  }
+  return "大小 " + bytes(node.size) + " · ID " + shortToken(node.token, 6, 4);
+}
+
+function treeRowTitle(node) {
+  const hints = [];
+  if (node.path) hints.push("path: " + asText(node.path));
+  if (node.token) hints.push("token: " + asText(node.token));
+  return hints.join("\n");
+}
+
+let treeRenderGeneration = 0;
+const TREE_FRAME_BUDGET_MS = 8;
+
+function renderTree(tree) {
+  const root = $id("driveTree");
+  const generation = ++treeRenderGeneration;
+  if (!tree) {
+    root.innerHTML = "<div class='muted small'>暂无数据</div>";
+    treeIndex = new Map();
+    return Promise.resolve();
+  }
+  let ul = root.firstElementChild;
+  if (!ul || ul.tagName !== "UL") {
+    root.replaceChildren();
+    ul = document.createElement("ul");
+    root.appendChild(ul);
+    treeIndex = new Map();
+  }
+  // Walk the tree with an explicit stack, one <ul> per step, yielding to the
+  // next frame whenever the budget is spent so big trees do not block the page.
+  const nextIndex = new Map();
+  const pending = [{ ul: ul, nodes: [tree], depth: 0 }];
+  return new Promise((resolve) => {
+    const step = () => {
+      if (generation !== treeRenderGeneration) {
+        resolve();
+        return;
+      }
+      const started = performance.now();
+      while (pending.length > 0 && performance.now() - started < TREE_FRAME_BUDGET_MS) {
+        syncTreeChildren(pending.pop(), nextIndex, pending);
+      }
+      if (pending.length > 0) {
+        window.requestAnimationFrame(step);
+        return;
+      }
+      treeIndex = nextIndex;
+      resolve();
+    };
+    step();
+  });
+}
+
+function syncTreeChildren(task, nextIndex, pending) {
+  // Reuse <li> nodes from the previous render by token; only new nodes are built.
+  const { ul, nodes, depth } = task;
+  const childTasks = [];
+  let cursor = ul.firstElementChild;
+  for (const node of nodes) {
+    const key = treeNodeKey(node);
+    const isFolder = node.type === "folder";
+    const expandable = isFolder && Array.isArray(node.children) && node.children.length > 0;
+    let li = nextIndex.has(key) ? undefined : treeIndex.get(key);
+    if (li?.dataset.kind === (isFolder ? "folder" : "file") && (li.dataset.expandable === "1") === expandable) {
+      updateTreeNode(li, node, depth);
+    } else {
+      li = renderTreeNode(node, depth);
+    }
+    nextIndex.set(key, li);
+    if (li._children) childTasks.push({ ul: li._children, nodes: node.children, depth: depth + 1 });
+    if (li === cursor) cursor = cursor.nextElementSibling;
+    else ul.insertBefore(li, cursor);
+  }
+  while (cursor) {
+    const stale = cursor;
+    cursor = cursor.nextElementSibling;
+    stale.remove();
+  }
+  for (let i = childTasks.length - 1; i >= 0; i -= 1) pending.push(childTasks[i]);
+}
+
+function updateTreeNode(li, node, depth) {
+  const isFolder = node.type === "folder";
+  const children = Array.isArray(node.children) ? node.children : [];
+  setTextIfChanged(li._name, treeNameText(node, depth === 0));
+  setTextIfChanged(li._meta, treeMetaText(node, isFolder, children));
+  const title = treeRowTitle(node);
+  if (li._row.title !== title) li._row.title = title;
+}
+
+function setTreeCollapsed(treeNode, collapsed) {
+  if (!treeNode || treeNode.dataset.expandable !== "1") return;
+  // The +/− glyph comes from CSS on .tree-collapsed; only the class and aria state change.
+  treeNode.classList.toggle("tree-collapsed", collapsed);
+  if (treeNode._toggle) treeNode._toggle.setAttribute("aria-expanded", collapsed ? "false" : "true");
+}
+
+function renderTreeNode(node, depth) {
+  const li = document.createElement("li");
+  const isFolder = node.type === "folder";
+  const children = Array.isArray(node.children) ? node.children : [];
+  const expandable = isFolder && children.length > 0;
+  li.dataset.kind = isFolder ? "folder" : "file";
+  if (expandable) li.dataset.expandable = "1";
+
+  const row = document.createElement("div");
+  row.className = "tree-row";
+
+  if (expandable) {
+    const toggle = document.createElement("button");
+    toggle.type = "button";
+    toggle.className = "tree-toggle";
+    toggle.title = "展开/折叠目录";
+    toggle.setAttribute("aria-expanded", "true");
+    row.appendChild(toggle);
+    li._toggle = toggle;
+    row.style.cursor = "pointer";
+  } else {
+    const toggle = document.createElement("span");
+    toggle.className = "tree-toggle placeholder";
+    toggle.textContent = "·";
+    row.appendChild(toggle);
+  }
+
+  const type = document.createElement("span");
+  type.className = "tree-type " + (isFolder ? "folder" : "file");
+  type.textContent = isFolder ? "目录" : "文件";
+  row.appendChild(type);
+
+  const name = document.createElement("span");
+  name.className = "tree-name";
+  name.textContent = treeNameText(node, depth === 0);
+  row.appendChild(name);
+
+  const meta = document.createElement("span");
+  meta.className = "tree-meta";
+  meta.textContent = treeMetaText(node, isFolder, children);
+  row.appendChild(meta);
+  const title = treeRowTitle(node);
+  if (title) row.title = title;
+  li.appendChild(row);
+  li._row = row;
+  li._name = name;
+  li._meta = meta;
+  li._children = null;
+
+  if (expandable) {
+    const ul = document.createElement("ul");
+    li._children = ul;
+    li.appendChild(ul);
+    if (depth >= 2) setTreeCollapsed(li, true);
+  }
+  return li;
+}
+
+function setAllTreeCollapsed(collapsed) {
+  // Collect first, then flip every class in one frame with the list
+  // detached, so the browser lays the tree out once on reattach.
+  const nodes = Array.from(document.querySelectorAll("#driveTree li[data-expandable='1']"));
+  if (nodes.length === 0) return 0;
+  window.requestAnimationFrame(() => {
+    const root = $id("driveTree");
+    const list = root.firstElementChild;
+    const scrollTop = root.scrollTop;
+    if (list) list.remove();
+    for (const node of nodes) setTreeCollapsed(node, collapsed);
+    if (list) root.appendChild(list);
+    root.scrollTop = scrollTop;
+  });
+  return nodes.length;
+}
+
+function expandAllTree() {
+  const count = setAllTreeCollapsed(false);
+  if (count === 0) {
+    setActionState("treeState", "没有可展开目录，请先刷新 Drive 树。", "warn");
+    return false;
+  }
+  setActionState("treeState", "目录树已全部展开（" + count + " 个目录，" + nowClock() + "）", "success");
+  return true;
+}
+
+function collapseAllTree() {
+  const count = setAllTreeCollapsed(true);
+  if (count === 0) {
+    setActionState("treeState", "没有可折叠目录，请先刷新 Drive 树。", "warn");
+    return false;
+  }
+  setActionState("treeState", "目录树已全部折叠（" + count + " 个目录，" + nowClock() + "）", "success");
+  return true;
+}
+
+function refreshTree() {
+  // Calls with the same depth/recycle-bin filter share the in-flight request.
+  const key = "tree:" + $id("treeDepth").value + ":" + $id("treeIncludeRecycle").checked;
+  return once(key, loadTree);
+}
+
+async function loadTree() {
+  const firstLoad = consumeFirstLoad("tree");
+  setActionState("treeState", "正在刷新 Drive 树...", "loading");
+  const treeRoot = $id("driveTree");
+  if (treeIndex.size === 0) treeRoot.textContent = "正在读取 Drive 树...";
+  const depth = Number($id("treeDepth").value || "3");
+  const includeRecycle = $id("treeIncludeRecycle").checked;
+  try {
+    const url = "/api/drive/tree?depth=" + encodeURIComponent(depth) + "&include_recycle_bin=" + (includeRecycle ? "true" : "false");
+    const data = await api("GET", url, undefined, { parseInWorker: true });
+    if (!data.ok) throw new Error(data.error || "获取 Drive 树失败");
+
+    $id("treeTokenType").textContent = asText(data.token_type);
+    const rootToken = asText(data.root_folder_token);
+    const rootTokenNode = $id("treeRootToken");
+    rootTokenNode.textContent = shortToken(rootToken, 8, 6);
+    rootTokenNode.title = rootToken === "-" ? "" : rootToken;
+    $id("treeFolderCount").textContent = asText(data.stats?.folders, "0");
+    $id("treeFileCount").textContent = asText(data.stats?.files, "0");
+    $id("treeTruncatedCount").textContent = asText(data.stats?.truncated_nodes, "0");
+    await renderTree(data.tree || null);
+    setActionState(
+      "treeState",
+      "Drive 树已刷新（目录 " + asText(data.stats?.folders, "0") + "，文件 " + asText(data.stats?.files, "0") + "，" + nowClock() + "）",
+      "success",
+    );
+    return true;
+  } catch (err) {
+    if (firstLoad) {
+      treeRoot.textContent = "Drive 树获取中，稍后自动重试...";
+      treeIndex = new Map();
+      setActionState("treeState", "Drive 树获取中，稍后自动重试...", "loading");
+      return true;
+    }
+    treeRoot.textContent = "读取 Drive 树失败：" + tErr(err.message);
+    treeIndex = new Map();
+    setActionState("treeState", "读取 Drive 树失败：" + tErr(err.message), "danger");
+    setMsg("读取 Drive 树失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+function refreshFeishu() {
+  return once("feishu", loadFeishu);
+}
+
+async function loadFeishu(options) {
+  const firstLoad = consumeFirstLoad("feishu");
+  setFeishuLamp("loading", "连接检测中", "正在校验 token 与 API 连通性...");
+  try {
+    const data = options && "section" in options ? dashboardSection(options.section) : await api("GET", "/api/status/feishu");
+    const errText = data.token?.error || data.connectivity?.error || "";
+    const rows = [
+      ["checked_at", toLocalTime(data.checked_at), ""],
+      ["app_id_configured", asYesNo(data.config?.app_id_configured), data.config?.app_id_configured ? "value-good" : "value-bad"],
+      ["app_secret_configured", asYesNo(data.config?.app_secret_configured), data.config?.app_secret_configured ? "value-good" : "value-bad"],
+      ["user_token_file", asText(data.config?.user_token_file), ""],
+      ["user_token_file_exists", asYesNo(data.config?.user_token_file_exists), data.config?.user_token_file_exists ? "value-good" : "value-warn"],
+      ["token.available", asYesNo(data.token?.available), data.token?.available ? "value-good" : "value-bad"],
+      ["token.type", asText(data.token?.type), ""],
+      ["connectivity.api_access", asYesNo(data.connectivity?.api_access), data.connectivity?.api_access ? "value-good" : "value-bad"],
+      ["connectivity.root_folder_token", asText(data.connectivity?.root_folder_token), ""],
+      ["error", errText ? tErr(errText) : "无", errText ? "value-bad" : ""]
+    ];
+    renderRows("feishuTable", rows);
+    const tokenAvailable = !!data.token?.available;
+    const apiAccess = !!data.connectivity?.api_access;
+    const checked = toLocalTime(data.checked_at);
+    if (tokenAvailable && apiAccess) {
+      const rootToken = asText(data.connectivity?.root_folder_token, "");
+      const detail = rootToken ? ("API 可访问，root_folder_token=" + shortToken(rootToken, 8, 6) + "（" + checked + "）") : ("API 可访问（" + checked + "）");
+      setFeishuLamp("ok", "飞书连接正常", detail);
+      setTopStat("topFeishuState", "正常", "good");
+    } else if (tokenAvailable && !apiAccess) {
+      setFeishuLamp("warn", "令牌可用，但 API 访问失败", errText ? tErr(errText) : "请检查 Drive 权限或网络。");
+      setTopStat("topFeishuState", "告警", "warn");
+    } else if (data.config?.app_id_configured && data.config?.app_secret_configured) {
+      setFeishuLamp("warn", "应用已配置，等待授权", errText ? tErr(errText) : "未检测到可用 user_access_token。");
+      setTopStat("topFeishuState", "待授权", "warn");
+    } else {
+      setFeishuLamp("bad", "飞书连接未就绪", "请先配置 app_id/app_secret 并完成授权。");
+      setTopStat("topFeishuState", "未就绪", "bad");
+    }
+    return true;
+  } catch (err) {
+    if (firstLoad) {
+      renderRows("feishuTable", ROWS_RETRYING);
+      setFeishuLamp("loading", "连接获取中", "服务启动后将自动重试。");
+      setTopStat("topFeishuState", "获取中", "info");
+      return true;
+    }
+    renderRows("feishuTable", [
+      ROW_READ_FAILED,
+      ["错误", tErr(err.message), "value-bad"]
+    ]);
+    setFeishuLamp("bad", "连接检查失败", tErr(err.message));
+    setTopStat("topFeishuState", "失败", "bad");
+    setMsg("读取飞书状态失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+const MAP_LOAD_STATE = Object.freeze({ loaded: "已加载", not_found: "未找到", masked: "已屏蔽" });
+const MAP_ACTIVE_STATE = Object.freeze({ active: "运行中", inactive: "未运行", failed: "失败", activating: "启动中", deactivating: "停止中" });
+const MAP_SUB_STATE = Object.freeze({ running: "运行中", exited: "已退出", dead: "已停止", auto_restart: "自动重启" });
+const MAP_UNIT_FILE_STATE = Object.freeze({ enabled: "已启用", disabled: "已禁用", static: "静态", masked: "已屏蔽" });
+
+function mapState(raw, mapping) {
+  const k = asText(raw, "-");
+  if (k === "-" || !Object.hasOwn(mapping, k)) return k;
+  return mapping[k] + "（" + k + "）";
+}
+
+function secText(sec) {
+  const n = Number(sec);
+  if (!Number.isFinite(n) || n < 0) return "-";
+  const h = Math.floor(n / 3600);
+  const m = Math.floor((n % 3600) / 60);
+  const s = Math.floor(n % 60);
+  if (h > 0) return h + "小时" + m + "分" + s + "秒";
+  if (m > 0) return m + "分" + s + "秒";
+  return s + "秒";
+}
+
+function renderAutoSyncTop() {
+  if (!schedulerInitialized || !autoSyncKnown) {
+    setTopStat("topAutoSyncState", "获取中", "info");
+    return;
+  }
+  if (!autoSyncEnabled) {
+    setTopStat("topAutoSyncState", "关闭", "warn");
+    return;
+  }
+  if (autoSyncLastResult === "running") {
+    setTopStat("topAutoSyncState", "执行中", "info");
+    return;
+  }
+  if (autoSyncLastResult === "failed") {
+    setTopStat("topAutoSyncState", "失败", "bad");
+    return;
+  }
+  if (autoSyncLastResult === "warning" || autoSyncLastResult === "skipped_busy") {
+    const suffix = Number.isFinite(Number(autoSyncNextRunInSec)) ? (" · 下次 " + secText(autoSyncNextRunInSec)) : "";
+    setTopStat("topAutoSyncState", "告警" + suffix, "warn");
+    return;
+  }
+  if (Number.isFinite(Number(autoSyncNextRunInSec))) {
+    const sec = Number(autoSyncNextRunInSec);
+    if (sec <= 0) setTopStat("topAutoSyncState", "开启 · 即将执行", "info");
+    else setTopStat("topAutoSyncState", "开启 · 下次 " + secText(sec), "good");
+    return;
+  }
+  setTopStat("topAutoSyncState", "开启", "good");
+}
+
+function ensureAutoSyncTicker() {
+  if (autoSyncTicker !== null || document.hidden) return;
+  // Countdown is derived from an absolute deadline and re-armed on each wall-clock
+  // second, so a late timer never accumulates drift.
+  const tick = () => {
+    if (autoSyncKnown && autoSyncEnabled && autoSyncLastResult !== "running" && autoSyncNextRunAtMs !== null) {
+      const sec = Math.max(0, Math.round((autoSyncNextRunAtMs - Date.now()) / 1000));
+      if (sec !== autoSyncNextRunInSec) {
+        autoSyncNextRunInSec = sec;
+        renderAutoSyncTop();
+      }
+    }
+    autoSyncTicker = window.setTimeout(tick, 1000 - (Date.now() % 1000));
+  };
+  autoSyncTicker = window.setTimeout(tick, 1000 - (Date.now() % 1000));
+}
+
+function stopAutoSyncTicker() {
+  if (autoSyncTicker === null) return;
+  window.clearTimeout(autoSyncTicker);
+  autoSyncTicker = null;
+}
+
+function refreshScheduler(options) {
+  return once("scheduler", () => loadScheduler(options));
+}
+
+async function loadScheduler(options) {
+  const firstLoad = consumeFirstLoad("scheduler");
+  try {
+    const data = options && "section" in options ? dashboardSection(options.section) : await api("GET", "/api/status/scheduler", undefined, {
+      priority: options?.background ? "low" : "auto",
+    });
+    const initialized = data.initialized === true;
+    const running = !!data.running;
+    const enabled = !!data.enabled;
+    const configuredInterval = Number(data.configured_interval_sec || 0);
+    const effectiveInterval = Number(data.effective_interval_sec || 0);
+
+    if (!initialized) {
+      renderRows("schedulerTable", [
+        ["checked_at", toLocalTime(data.checked_at), ""],
+        ["scheduler_initialized", "获取中", "value-warn"],
+        ["scheduler_running", "获取中", "value-warn"],
+        ["auto_sync_enabled", "获取中", "value-warn"],
+        ["last_result", "初始化中", "value-warn"],
+      ]);
+      schedulerInitialized = false;
+      autoSyncKnown = false;
+      autoSyncEnabled = false;
+      autoSyncLastResult = "";
+      autoSyncNextRunInSec = null;
+      autoSyncNextRunAtMs = null;
+      renderAutoSyncTop();
+      setRunBadge("loading", "调度器初始化中...");
+      return true;
+    }
+
+    const rows = [
+      ["checked_at", toLocalTime(data.checked_at), ""],
+      ["scheduler_initialized", asYesNo(initialized), "value-good"],
+      ["scheduler_running", asYesNo(running), running ? "value-good" : "value-bad"],
+      ["auto_sync_enabled", asYesNo(enabled), enabled ? "value-good" : "value-warn"],
+      ["poll_interval_sec(configured)", asText(configuredInterval), enabled ? "" : "value-warn"],
+      ["poll_interval_sec(effective)", asText(effectiveInterval), (enabled && configuredInterval !== effectiveInterval) ? "value-warn" : ""],
+      ["next_run_at", toLocalTime(data.next_run_at), ""],
+      ["next_run_in", secText(data.next_run_in_sec), ""],
+      ["last_started_at", toLocalTime(data.last_started_at), ""],
+      ["last_finished_at", toLocalTime(data.last_finished_at), ""],
+      ["last_result", asText(data.last_result, enabled ? "waiting" : "disabled"), data.last_result === "failed" ? "value-bad" : (data.last_result === "warning" || data.last_result === "skipped_busy" ? "value-warn" : "value-good")],
+      ["run_count", asText(data.run_count, "0"), ""],
+      ["skipped_busy_count", asText(data.skipped_busy_count, "0"), Number(data.skipped_busy_count || 0) > 0 ? "value-warn" : ""],
+      ["last_error", data.last_error ? tErr(data.last_error) : "无", data.last_error ? "value-bad" : ""]
+    ];
+    renderRows("schedulerTable", rows);
+
+    schedulerInitialized = true;
+    autoSyncKnown = true;
+    autoSyncEnabled = enabled;
+    autoSyncLastResult = asText(data.last_result, "");
+    autoSyncNextRunInSec = Number.isFinite(Number(data.next_run_in_sec)) ? Number(data.next_run_in_sec) : null;
+    autoSyncNextRunAtMs = autoSyncNextRunInSec === null ? null : Date.now() + autoSyncNextRunInSec * 1000;
+    renderAutoSyncTop();
+
+    if (!enabled) {
+      setRunBadge("idle", "自动同步已关闭，仅手动执行");
+    } else if (data.last_result === "running") {
+      setRunBadge("running", "自动同步正在执行中");
+      setTopStat("topLastRunState", "同步执行中", "info");
+    } else if (data.last_result === "failed") {
+      setRunBadge("failed", "自动同步最近一次失败");
+    } else if (data.last_result === "warning" || data.last_result === "skipped_busy") {
+      setRunBadge("idle", "自动同步已启用，最近一次有告警");
+    } else {
+      setRunBadge("idle", "自动同步已启用");
+    }
+    return true;
+  } catch (err) {
+    if (firstLoad) {
+      renderRows("schedulerTable", ROWS_RETRYING);
+      schedulerInitialized = false;
+      autoSyncKnown = false;
+      autoSyncEnabled = false;
+      autoSyncLastResult = "";
+      autoSyncNextRunInSec = null;
+      autoSyncNextRunAtMs = null;
+      renderAutoSyncTop();
+      setRunBadge("loading", "正在获取同步状态...");
+      return true;
+    }
+    renderRows("schedulerTable", [
+      ROW_READ_FAILED,
+      ["错误", tErr(err.message), "value-bad"]
+    ]);
+    schedulerInitialized = true;
+    autoSyncKnown = true;
+    autoSyncEnabled = false;
+    autoSyncLastResult = "failed";
+    autoSyncNextRunInSec = null;
+    autoSyncNextRunAtMs = null;
+    renderAutoSyncTop();
+    setTopStat("topAutoSyncState", "失败", "bad");
+    setMsg("读取调度状态失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+function refreshEventCallback(options) {
+  return once("eventCallback", () => loadEventCallback(options));
+}
+
+async function loadEventCallback(options) {
+  const firstLoad = consumeFirstLoad("eventCallback");
+  try {
+    const data = options && "section" in options ? dashboardSection(options.section) : await api("GET", "/api/status/event-callback", undefined, {
+      priority: options?.background ? "low" : "auto",
+    });
+    const rows = [
+      ["checked_at", toLocalTime(data.checked_at), ""],
+      ["enabled", asYesNo(data.enabled), data.enabled ? "value-good" : "value-warn"],
+      ["verify_token_configured", asYesNo(data.verify_token_configured), data.verify_token_configured ? "value-good" : "value-warn"],
+      ["encrypt_key_configured", asYesNo(data.encrypt_key_configured), data.encrypt_key_configured ? "value-good" : ""],
+      ["debounce_sec", asText(data.debounce_sec, "15"), ""],
+      ["trigger_types", Array.isArray(data.trigger_types) ? data.trigger_types.join(", ") : "-", ""],
+      ["pending", asYesNo(data.pending), data.pending ? "value-warn" : ""],
+      ["last_received_at", toLocalTime(data.last_received_at), ""],
+      ["last_event_type", asText(data.last_event_type), ""],
+      ["last_event_id", asText(data.last_event_id), ""],
+      ["last_result", asText(data.last_result), data.last_result === "failed" ? "value-bad" : (data.last_result === "warning" ? "value-warn" : "")],
+      ["last_error", data.last_error ? tErr(data.last_error) : "无", data.last_error ? "value-bad" : ""],
+      ["received / triggered", asText(data.received_count, "0") + " / " + asText(data.trigger_count, "0"), ""],
+      ["duplicate_count", asText(data.duplicate_count, "0"), Number(data.duplicate_count || 0) > 0 ? "value-warn" : ""],
+      ["skipped(debounce/pending/busy/unmatched/disabled)", asText(data.skipped_debounce_count, "0") + " / " + asText(data.skipped_pending_count, "0") + " / " + asText(data.skipped_busy_count, "0") + " / " + asText(data.skipped_unmatched_count, "0") + " / " + asText(data.skipped_disabled_count, "0"), ""]
+    ];
+    renderRows("eventCallbackTable", rows);
+    return true;
+  } catch (err) {
+    if (firstLoad) {
+      renderRows("eventCallbackTable", ROWS_RETRYING);
+      return true;
+    }
+    renderRows("eventCallbackTable", [
+      ROW_READ_FAILED,
+      ["错误", tErr(err.message), "value-bad"]
+    ]);
+    setMsg("读取事件回调状态失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+function refreshService() {
+  return once("service", loadService);
+}
+
+async function loadService(options) {
+  const firstLoad = consumeFirstLoad("service");
+  try {
+    const data = options && "section" in options ? dashboardSection(options.section) : await api("GET", "/api/status/service");
+    const active = asText(data.active_state, "-");
+    const rows = [
+      ["checked_at", toLocalTime(data.checked_at), ""],
+      ["systemd_available", asYesNo(data.systemd_available), data.systemd_available ? "value-good" : "value-bad"],
+      ["load_state", mapState(data.load_state, MAP_LOAD_STATE), ""],
+      ["active_state", mapState(active, MAP_ACTIVE_STATE), active === "active" ? "value-good" : "value-bad"],
+      ["sub_state", mapState(data.sub_state, MAP_SUB_STATE), ""],
+      ["unit_file_state", mapState(data.unit_file_state, MAP_UNIT_FILE_STATE), ""],
+      ["main_pid", asText(data.main_pid), ""],
+      ["error", data.error ? tErr(data.error) : "无", data.error ? "value-bad" : ""]
+    ];
+    renderRows("serviceTable", rows);
+    setTopStat("topServiceState", active === "active" ? "运行中" : asText(active, "未知"), active === "active" ? "good" : "warn");
+    return true;
+  } catch (err) {
+    if (firstLoad) {
+      renderRows("serviceTable", ROWS_RETRYING);
+      setTopStat("topServiceState", "获取中", "info");
+      return true;
+    }
+    renderRows("serviceTable", [
+      ROW_READ_FAILED,
+      ["错误", tErr(err.message), "value-bad"]
+    ]);
+    setTopStat("topServiceState", "失败", "bad");
+    setMsg("读取服务状态失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+function runSummarySourceText(source) {
+  if (source === "last_run_once") return "最近摘要文件";
+  if (source === "history_fallback" || source === "history") return "历史记录回退";
+  return "未知";
+}
+
+function renderRunSummary(summary, source) {
+  if (autoSyncLastResult === "running") {
+    setTopStat("topLastRunState", "同步执行中", "info");
+  }
+  if (!summary) {
+    renderRows("runSummaryTable", [["状态", "暂无同步摘要（等待首次同步完成）", ""]]);
+    if (autoSyncLastResult !== "running") setTopStat("topLastRunState", "暂无记录", "warn");
+    return;
+  }
+  // Read each field once; several feed both a row and a tone/top-stat decision.
+  const {
+    run_id: runId,
+    local_total: localTotal,
+    remote_total: remoteTotal,
+    uploaded,
+    downloaded,
+    renamed,
+    retry_success: retrySuccess,
+    retry_failed: retryFailed,
+  } = summary;
+  const errors = Number(summary.errors || 0);
+  const fatal = asText(summary.fatal_error, "");
+  const conflicts = Number(summary.conflicts || 0);
+  const remoteSoftDeleted = Number(summary.remote_soft_deleted || 0);
+  const remoteHardDeleted = Number(summary.remote_hard_deleted || 0);
+  const localSoftDeleted = Number(summary.local_soft_deleted || 0);
+  const remoteEmptyDirsDeleted = Number(summary.remote_empty_dirs_deleted || 0);
+  const remoteDirsDeleted = Number(summary.remote_dirs_deleted || 0);
+  const remoteDirsRecursiveDeleted = Number(summary.remote_dirs_recursive_deleted || 0);
+  renderRows("runSummaryTable", [
+    ["summary_source", runSummarySourceText(asText(source, "last_run_once")), (source === "history_fallback" || source === "history") ? "value-warn" : ""],
+    ["run_id", asText(runId), ""],
+    ["local_root", asText(summary.local_root), ""],
+    ["remote_root_token", asText(summary.remote_root_token), ""],
+    ["local_total / remote_total", asText(localTotal, "0") + " / " + asText(remoteTotal, "0"), ""],
+    ["uploaded / downloaded / renamed", asText(uploaded, "0") + " / " + asText(downloaded, "0") + " / " + asText(renamed, "0"), ""],
+    ["remote_delete(soft/hard)", asText(remoteSoftDeleted, "0") + " / " + asText(remoteHardDeleted, "0"), remoteHardDeleted > 0 ? "value-warn" : ""],
+    ["local_soft_deleted", asText(localSoftDeleted, "0"), ""],
+    ["remote_dirs_deleted(total/recursive/empty)", asText(remoteDirsDeleted, "0") + " / " + asText(remoteDirsRecursiveDeleted, "0") + " / " + asText(remoteEmptyDirsDeleted, "0"), remoteDirsRecursiveDeleted > 0 ? "value-warn" : ""],
+    ["conflicts", asText(summary.conflicts, "0"), conflicts > 0 ? "value-warn" : ""],
+    ["retry_success / retry_failed", asText(retrySuccess, "0") + " / " + asText(retryFailed, "0"), ""],
+    ["errors", asText(errors, "0"), errors > 0 ? "value-bad" : "value-good"],
+    ["fatal_error", fatal ? tErr(fatal) : "无", fatal ? "value-bad" : ""]
+  ]);
+  if (autoSyncLastResult !== "running") {
+    const failed = Boolean(fatal) || errors > 0;
+    setTopStat("topLastRunState", "第" + asText(runId, "-") + (failed ? "次（异常）" : "次（成功）"), failed ? "warn" : "good");
+  }
+}
+
+function refreshRunSummary() {
+  return once("runSummary", loadRunSummary);
+}
+
+async function loadRunSummary(options) {
+  const firstLoad = consumeFirstLoad("runSummary");
+  try {
+    const data = options && "section" in options ? dashboardSection(options.section) : await api("GET", "/api/status/run-once");
+    let summary = data.summary || null;
+    let source = asText(data.summary_source, "last_run_once");
+
+    if (!summary) {
+      try {
+        const hist = await api("GET", "/api/history?limit=1");
+        const items = Array.isArray(hist.items) ? hist.items : [];
+        if (items.length > 0) {
+          summary = items[0];
+          source = "history";
+        }
+      } catch (_err) {}
+    }
+
+    if (!summary && firstLoad) {
+      renderRows("runSummaryTable", [
+        ["状态", "获取中（等待首次同步完成）", "value-warn"]
+      ]);
+      setTopStat("topLastRunState", "获取中", "info");
+      return true;
+    }
+
+    renderRunSummary(summary, source);
+    return true;
+  } catch (err) {
+    if (firstLoad) {
+      renderRows("runSummaryTable", ROWS_RETRYING);
+      setTopStat("topLastRunState", "获取中", "info");
+      return true;
+    }
+    renderRows("runSummaryTable", [
+      ROW_READ_FAILED,
+      ["错误", tErr(err.message), "value-bad"]
+    ]);
+    setTopStat("topLastRunState", "读取失败", "bad");
+    return false;
+  }
+}
+
+async function clearLastRunError() {
+  setActionState("runtimeState", "正在清空最近异常标记...", "loading");
+  try {
+    const data = await api("POST", "/api/actions/clear-last-run", {});
+    await refreshRunSummary();
+    if (data.cleared) {
+      setMsg("最近同步异常已清空，最近记录已保留。", "success");
+      setActionState("runtimeState", "最近异常已清空（" + nowClock() + "）", "success");
+    } else {
+      setMsg("当前无异常可清空，最近记录已保留。", "info");
+      setActionState("runtimeState", "当前无异常可清空（" + nowClock() + "）", "success");
+    }
+    return true;
+  } catch (err) {
+    setActionState("runtimeState", "清空异常失败：" + tErr(err.message), "danger");
+    setMsg("清空异常失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+async function viewLastRunDetail() {
+  activateTab("logs");
+  $id("logN").value = "300";
+  $id("logLevel").value = "WARNING";
+  $id("logModule").value = "sync";
+  setMsg("已切到日志巡检：level=WARNING，module=sync（可看到 remote_rename_failed 等异常详情）。", "info");
+  return refreshLogs();
+}
+
+async function runOnce() {
+  kickPoll();
+  setActionState("runtimeState", "正在执行一次同步...", "loading");
+  setRunBadge("running", "正在执行同步，请稍候");
+  setTopStat("topLastRunState", "执行中", "info");
+  try {
+    const data = await api("POST", "/api/actions/run-once", {}, { timeoutMs: RUN_ONCE_REQUEST_TIMEOUT_MS });
+    renderRunSummary(data || null);
+    const hasErr = Boolean(data.fatal_error) || Number(data.errors || 0) > 0;
+    if (hasErr) {
+      setRunBadge("failed", "同步已完成，但有错误");
+      setActionState("runtimeState", "本轮同步完成，但存在错误（" + nowClock() + "）", "warn");
+      setMsg("同步完成，但存在错误，请查看 run summary。", "warn");
+    } else {
+      setRunBadge("success", "同步执行成功");
+      setActionState("runtimeState", "本轮同步成功完成（" + nowClock() + "）", "success");
+      setMsg("同步执行成功。", "success");
+    }
+    await settleAll([refreshFeishu(), refreshTree(), refreshLogs(), refreshScheduler()]);
+    return !hasErr;
+  } catch (err) {
+    const message = tErr(err?.message ? err.message : err);
+    if (message.indexOf("请求超时") >= 0) {
+      await settleAll([refreshRunSummary(), refreshScheduler(), refreshLogs()]);
+      setRunBadge("idle", "请求超时，已自动刷新状态");
+      setActionState("runtimeState", "请求超时，已回读最近状态（" + nowClock() + "）", "warn");
+      setMsg("执行请求超时：同步可能已在后台完成，面板已自动刷新。", "warn");
+      return false;
+    }
+    setRunBadge("failed", "同步执行失败");
+    setActionState("runtimeState", "同步执行失败：" + message, "danger");
+    setMsg("执行同步失败：" + message, "danger");
+    return false;
+  }
+}
+
+async function restartService() {
+  kickPoll();
+  setActionState("runtimeState", "正在发送服务重启指令...", "loading");
+  try {
+    await api("POST", "/api/actions/restart", {});
+    setMsg("重启命令已发送。", "success");
+    const ok = await refreshService();
+    await refreshScheduler();
+    setActionState(
+      "runtimeState",
+      ok ? ("重启命令已发送，服务状态已刷新（" + nowClock() + "）") : "重启命令已发送，但状态刷新失败",
+      ok ? "success" : "warn",
+    );
+    return ok;
+  } catch (err) {
+    setActionState("runtimeState", "重启服务失败：" + tErr(err.message), "danger");
+    setMsg("重启服务失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+async function settleAll(promises) {
+  // Every refresh runs to completion; one that throws only marks its own slot as failed.
+  const results = await Promise.allSettled(promises);
+  return results.map((r) => {
+    if (r.status === "rejected") console.warn(r.reason);
+    return r.status === "fulfilled" && !!r.value;
+  });
+}
+
+const DASHBOARD_LOADERS = Object.freeze({
+  feishu: loadFeishu,
+  service: loadService,
+  scheduler: loadScheduler,
+  event_callback: loadEventCallback,
+  run_summary: loadRunSummary,
+});
+const DASHBOARD_POLL_SECTIONS = Object.freeze(["scheduler", "event_callback"]);
+const POLL_MIN_DELAY_MS = 5000;
+const POLL_MAX_DELAY_MS = 60000;
+const POLL_JITTER_MS = 1000;
+let pollDelayMs = POLL_MIN_DELAY_MS;
+let pollTimer = null;
+let lastPollFingerprint = "";
+
+function pollFingerprint(payload) {
+  // Countdown/timestamp fields change on every poll and do not count as a state change.
+  const sections = DASHBOARD_POLL_SECTIONS.map((name) => payload[name]);
+  return JSON.stringify(sections, (key, value) => (key === "checked_at" || key === "next_run_in_sec" ? undefined : value));
+}
+
+function schedulePoll() {
+  if (pollTimer !== null) window.clearTimeout(pollTimer);
+  pollTimer = null;
+  if (document.hidden) return;
+  pollTimer = window.setTimeout(runPoll, pollDelayMs + Math.random() * POLL_JITTER_MS);
+}
+
+async function runPoll() {
+  pollTimer = null;
+  const before = lastPollFingerprint;
+  await refreshDashboard({ sections: DASHBOARD_POLL_SECTIONS, background: true }).catch(() => {});
+  // Back off while nothing changes; drop back to the short delay as soon as something does.
+  pollDelayMs = lastPollFingerprint === before ? Math.min(pollDelayMs * 1.5, POLL_MAX_DELAY_MS) : POLL_MIN_DELAY_MS;
+  schedulePoll();
+}
+
+function kickPoll() {
+  pollDelayMs = POLL_MIN_DELAY_MS;
+  schedulePoll();
+}
+
+function dashboardSection(section) {
+  if (!section || section.section_failed) throw new Error(section?.error || "dashboard_section_missing");
+  return section;
+}
+
+function refreshDashboard(options) {
+  // One /api/dashboard round trip feeds the existing per-section renderers.
+  const names = options?.sections || Object.keys(DASHBOARD_LOADERS);
+  return once("dashboard:" + names.join(","), async () => {
+    let payload;
+    try {
+      payload = await api("GET", "/api/dashboard?sections=" + names.join(","), undefined, {
+        priority: options?.background ? "low" : "auto",
+      });
+    } catch (err) {
+      const failed = { section_failed: true, error: err.message };
+      payload = Object.fromEntries(names.map((name) => [name, failed]));
+    }
+    if (DASHBOARD_POLL_SECTIONS.every((name) => name in payload)) lastPollFingerprint = pollFingerprint(payload);
+    return settleAll(names.map((name) => DASHBOARD_LOADERS[name]({ section: payload[name] })));
+  });
+}
+
+function refreshRuntime() {
+  return once("runtime", loadRuntime);
+}
+
+async function loadRuntime() {
+  setActionState("runtimeState", "正在刷新运行状态...", "loading");
+  const results = await refreshDashboard();
+  const ok = results.every((v) => !!v);
+  setActionState(
+    "runtimeState",
+    ok ? ("运行状态已刷新（" + nowClock() + "）") : "运行状态已刷新，但存在异常项，请查看本区详情",
+    ok ? "success" : "warn",
+  );
+  return ok;
+}
+
+const LOG_RENDER_CHUNK_CHARS = 32 * 1024;
+let logRenderGeneration = 0;
+
+function renderLogText(pane, text) {
+  // Small tails go in at once; large ones are appended in newline-aligned slices
+  // across frames so one huge text node does not block a paint.
+  const generation = ++logRenderGeneration;
+  if (text.length <= LOG_RENDER_CHUNK_CHARS) {
+    pane.textContent = text;
+    return;
+  }
+  pane.textContent = "";
+  let start = 0;
+  const step = () => {
+    if (generation !== logRenderGeneration) return;
+    let end = Math.min(text.length, start + LOG_RENDER_CHUNK_CHARS);
+    if (end < text.length) {
+      const nl = text.indexOf("\n", end);
+      end = nl === -1 ? text.length : nl + 1;
+    }
+    pane.appendChild(document.createTextNode(text.slice(start, end)));
+    start = end;
+    if (start < text.length) window.requestAnimationFrame(step);
+  };
+  step();
+}
+
+function refreshLogs() {
+  const key = "logs:" + [$id("logN").value, $id("logLevel").value, $id("logModule").value].join("|");
+  return once(key, loadLogs);
+}
+
+// Text shown for the current filter; later refreshes only fetch bytes past `offset`.
+let logView = { key: "", offset: 0, text: "", count: 0 };
+
+function dropLeadingLines(text, k) {
+  // Walks newlines in place instead of splitting the tail into an array.
+  let i = -1;
+  for (let left = k; left > 0; left -= 1) {
+    i = text.indexOf("\n", i + 1);
+    if (i === -1) return "";
+  }
+  return text.slice(i + 1);
+}
+
+async function loadLogs() {
+  const firstLoad = consumeFirstLoad("logs");
+  setActionState("logsState", "正在读取日志...", "loading");
+  const n = Number($id("logN").value || "200");
+  const level = $id("logLevel").value.trim();
+  const module = $id("logModule").value.trim();
+  const logPane = $id("logPane");
+  const limit = Number.isFinite(n) ? Math.max(1, n) : 200;
+  const key = limit + "|" + level + "|" + module;
+  const incremental = logView.key === key && logView.offset > 0;
+  let url = "/api/logs?items=false&n=" + limit;
+  if (level) url += "&level=" + encodeURIComponent(level);
+  if (module) url += "&module=" + encodeURIComponent(module);
+  if (incremental) url += "&since=" + logView.offset;
+  try {
+    const data = await api("GET", url);
+    const incoming = data.tail ? String(data.tail) : "";
+    const incomingCount = Number(data.count) || 0;
+    const append = incremental && !data.reset;
+    let text = incoming;
+    let count = incomingCount;
+    if (append) {
+      text = logView.count > 0 && incomingCount > 0 ? logView.text + "\n" + incoming : (logView.text || incoming);
+      count = logView.count + incomingCount;
+    }
+    if (count > limit) {
+      text = dropLeadingLines(text, count - limit);
+      count = limit;
+    }
+    logView = { key: key, offset: Number(data.next_offset) || 0, text: text, count: count };
+    if (!append || incomingCount > 0) renderLogText(logPane, text);
+    setActionState("logsState", "日志已刷新（" + count + " 行，" + nowClock() + "）", "success");
+    return true;
+  } catch (err) {
+    logView = { key: "", offset: 0, text: "", count: 0 };
+    if (firstLoad) {
+      renderLogText(logPane, "日志获取中，稍后自动重试...");
+      setActionState("logsState", "日志获取中，稍后自动重试...", "loading");
+      return true;
+    }
+    renderLogText(logPane, "读取日志失败：" + tErr(err.message));
+    setActionState("logsState", "读取日志失败：" + tErr(err.message), "danger");
+    setMsg("读取日志失败：" + tErr(err.message), "danger");
+    return false;
+  }
+}
+
+function refreshAll(options) {
+  return once("all", () => loadAll(options));
+}
+
+async function loadAll(options) {
+  const initial = !!options?.initial;
+  setMsg(initial ? "正在加载面板..." : "正在刷新全部面板...", "info");
+  const [configOk, treeOk, runtimeOk, logsOk] = await settleAll([
+    refreshConfigView(),
+    refreshTree(),
+    refreshRuntime(),
+    refreshLogs(),
+  ]);
+  const ok = configOk && treeOk && runtimeOk && logsOk;
+  if (ok) {
+    setMsg(initial ? "面板加载完成。" : "全部面板已刷新。", "success");
+  } else {
+    setMsg(
+      initial ? "部分面板仍在获取中，可稍后再点“刷新全部”。" : "刷新完成，但部分区域有异常，请查看各区提示。",
+      initial ? "info" : "warn",
+    );
+  }
+  return ok;
+}
+
+document.querySelector(".tabs").addEventListener("click", (event) => {
+  const tab = event.target.closest(".tab");
+  if (tab?.dataset.tab) activateTab(tab.dataset.tab);
+});
+bindButtonAction("btnRefreshAllTop", "刷新中...", refreshAll);
+$id("btnGoRuntime").addEventListener("click", () => activateTab("runtime"));
+
+bindButtonAction("btnSaveConfig", "保存中...", saveConfig);
+bindButtonAction("btnAuthUrl", "生成中...", genAuthUrl);
+bindButtonAction("btnExchangeCode", "交换中...", exchangeCode);
+bindButtonAction("btnRefreshToken", "刷新中...", refreshToken);
+$id("fPollIntervalPreset").addEventListener("change", (event) => {
+  const value = asText(event.target.value, "");
+  if (value !== "") {
+    $id("fPollIntervalSec").value = value;
+    setActionState("configState", "已应用间隔预设，请点击“保存基础配置”生效。", "loading");
+  }
+});
+
+$id("driveTree").addEventListener("click", (event) => {
+  const row = event.target.closest(".tree-row");
+  if (!row) return;
+  const li = row.parentElement;
+  if (!li || li.dataset.expandable !== "1") return;
+  event.preventDefault();
+  setTreeCollapsed(li, !li.classList.contains("tree-collapsed"));
+});
+bindButtonAction("btnRefreshTree", "刷新中...", refreshTree);
+bindButtonAction("btnExpandAllTree", "展开中...", async () => expandAllTree());
+bindButtonAction("btnCollapseAllTree", "折叠中...", async () => collapseAllTree());
+bindButtonAction("btnRunOnce", "执行中...", runOnce);
+bindButtonAction("btnRestartService", "重启中...", restartService);
+bindButtonAction("btnRefreshRuntime", "刷新中...", refreshRuntime);
+bindButtonAction("btnViewLastRunDetail", "跳转中...", viewLastRunDetail);
+bindButtonAction("btnClearLastRunError", "清空中...", clearLastRunError);
+bindButtonAction("btnRefreshLogs", "刷新中...", refreshLogs);
+
+ensureAutoSyncTicker();
+refreshAll({ initial: true });
+schedulePoll();
+document.addEventListener("visibilitychange", () => {
+  if (document.hidden) {
+    stopAutoSyncTicker();
+    schedulePoll();
+    return;
+  }
+  // The countdown was frozen while hidden; resync it from the server first.
+  refreshDashboard({ sections: DASHBOARD_POLL_SECTIONS }).catch(() => {});
+  renderAutoSyncTop();
+  ensureAutoSyncTicker();
+  kickPoll();
+});
@@ -1,10 +1,33 @@
+import asyncio
+import copy
 import json
 from pathlib import Path
 
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
 from app.core.config import AppConfig
 from app.web import api as api_module
 
 
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(api_module.router)
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def _cfg_template() -> AppConfig:
+    return AppConfig()
+
+
+@pytest.fixture
+def cfg(_cfg_template) -> AppConfig:
+    return copy.deepcopy(_cfg_template)
+
+
 def test_healthz_returns_alive():
     payload = api_module.healthz()
     assert payload["ok"] is True
@@ -12,8 +35,7 @@ def test_healthz_returns_alive():
     assert "checked_at" in payload
 
 
-def test_readyz_returns_200_when_checks_pass(monkeypatch, tmp_path: Path):
-    cfg = AppConfig()
+def test_readyz_returns_200_when_checks_pass(cfg, monkeypatch, tmp_path: Path):
     cfg.database.path = str(tmp_path / "runtime" / "service.db")
     cfg.logging.file = str(tmp_path / "runtime" / "service.log")
     cfg.sync.local_root = cfg.sync.local_root
@@ -66,8 +88,7 @@ def test_readyz_returns_503_when_config_load_fails(monkeypatch):
     assert any("config_load_failed" in err for err in payload["errors"])
 
 
-def test_readyz_warns_when_event_callback_enabled_without_verify_token(monkeypatch, tmp_path: Path):
-    cfg = AppConfig()
+def test_readyz_warns_when_event_callback_enabled_without_verify_token(cfg, monkeypatch, tmp_path: Path):
     cfg.database.path = str(tmp_path / "runtime" / "service.db")
     cfg.logging.file = str(tmp_path / "runtime" / "service.log")
     cfg.sync.event_callback_enabled = True
@@ -100,3 +121,98 @@ def test_readyz_warns_when_event_callback_enabled_without_verify_token(monkeypat
     payload = json.loads(resp.body.decode("utf-8"))
     assert payload["checks"]["event_callback_config_ok"] is False
     assert "event_callback_enabled_but_verify_token_missing" in payload["warnings"]
+
+
+def test_dashboard_isolates_failing_sections(monkeypatch):
+    def _raise_service_status():
+        raise RuntimeError("systemctl_timeout")
+
+    monkeypatch.setattr(api_module, "service_status", _raise_service_status)
+    monkeypatch.setattr(api_module, "scheduler_status", lambda: {"ok": True, "running": True})
+
+    payload = asyncio.run(api_module.dashboard_status(sections="scheduler,service"))
+    assert payload["ok"] is False
+    assert payload["scheduler"] == {"ok": True, "running": True}
+    assert payload["service"]["section_failed"] is True
+    assert payload["service"]["error"] == "systemctl_timeout"
+    assert "feishu" not in payload
+
+
+def test_config_get_revalidates_with_etag(client, cfg, monkeypatch, tmp_path: Path):
+    cfg.database.path = str(tmp_path / "runtime" / "service.db")
+    monkeypatch.setattr(api_module, "load_config", lambda: cfg)
+
+    first = client.get("/api/config")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.json()["web_port"] == cfg.web_port
+
+    second = client.get("/api/config", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+
+    cfg.web_port = cfg.web_port + 1
+    third = client.get("/api/config", headers={"If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["etag"] != etag
+
+
+def test_logs_response_is_gzip_encoded(cfg, monkeypatch, tmp_path: Path):
+    from app.web import main as main_module
+
+    cfg.database.path = str(tmp_path / "runtime" / "service.db")
+    cfg.logging.file = str(tmp_path / "runtime" / "service.log")
+    Path(cfg.logging.file).parent.mkdir(parents=True, exist_ok=True)
+    Path(cfg.logging.file).write_text(
+        "".join(f"2024-01-01 00:00:00 INFO app.sync: line {i}\n" for i in range(200)),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(main_module, "load_config", lambda: cfg)
+    monkeypatch.setattr(api_module, "load_config", lambda: cfg)
+
+    client = TestClient(main_module.build_app(), client=("127.0.0.1", 50000))
+    resp = client.get("/api/logs?n=200&items=false", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["vary"]
+    assert resp.json()["count"] == 200
+
+
+def test_run_once_status_rereads_summary_only_after_rewrite(monkeypatch, tmp_path: Path):
+    path = tmp_path / "last_run_once.json"
+    path.write_text(json.dumps({"run_id": "r1"}), encoding="utf-8")
+    monkeypatch.setattr(api_module, "LAST_RUN_ONCE_PATH", path)
+
+    reads: list[str] = []
+    original_read_text = Path.read_text
+
+    def _counting_read_text(self, *args, **kwargs):
+        reads.append(str(self))
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _counting_read_text)
+
+    assert api_module.last_run_once_status()["summary"]["run_id"] == "r1"
+    assert api_module.last_run_once_status()["summary"]["run_id"] == "r1"
+    assert reads.count(str(path)) == 1
+
+    path.write_text(json.dumps({"run_id": "r2-rewritten"}), encoding="utf-8")
+    assert api_module.last_run_once_status()["summary"]["run_id"] == "r2-rewritten"
+
+
+def test_local_changes_during_and_right_after_a_sync_are_ignored(monkeypatch):
+    monkeypatch.setattr(api_module, "_local_change_at", None)
+    monkeypatch.setattr(api_module, "_local_change_ignore_until", 0.0)
+
+    with api_module.SYNC_RUN_LOCK:
+        api_module._note_local_change()
+    assert api_module._local_change_at is None
+
+    api_module._note_local_change()
+    assert api_module._local_change_at is not None
+
+    api_module._reset_local_change()
+    assert api_module._local_change_at is None
+    api_module._note_local_change()
+    assert api_module._local_change_at is None
@@ -58,3 +58,30 @@ def test_load_config_falls_back_when_template_invalid(monkeypatch, tmp_path: Pat
 
     assert target.exists()
     assert cfg.sync.default_sync_direction == "remote_wins"
+
+
+def test_load_config_reparses_only_after_file_changes(monkeypatch, tmp_path: Path):
+    target = tmp_path / "config.yaml"
+    target.write_text("web_port: 9001\n", encoding="utf-8")
+    monkeypatch.setattr(config_module, "ensure_runtime_dirs", lambda _cfg: None)
+    config_module.clear_config_cache()
+
+    first = config_module.load_config(target)
+    first.web_port = 1
+    assert config_module.load_config(target).web_port == 9001
+
+    target.write_text("web_port: 9002\n# changed\n", encoding="utf-8")
+    assert config_module.load_config(target).web_port == 9002
+
+
+def test_load_config_recreates_runtime_dirs_on_cache_hit(monkeypatch, tmp_path: Path):
+    target = tmp_path / "config.yaml"
+    target.write_text("web_port: 9001\n", encoding="utf-8")
+    calls: list[int] = []
+    monkeypatch.setattr(config_module, "ensure_runtime_dirs", lambda cfg: calls.append(cfg.web_port))
+    config_module.clear_config_cache()
+
+    config_module.load_config(target)
+    config_module.load_config(target)
+
+    assert calls == [9001, 9001]
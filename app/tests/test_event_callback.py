@@ -1,3 +1,4 @@
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -5,41 +6,18 @@ from app.core.config import AppConfig
 from app.web import api as api_module
 
 
-def _build_client() -> TestClient:
+@pytest.fixture(scope="module")
+def client() -> TestClient:
     app = FastAPI()
     app.include_router(api_module.router)
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
 def _reset_event_state() -> None:
     api_module._event_recent_ids.clear()
     api_module._event_state.clear()
-    api_module._event_state.update(
-        {
-            "enabled": False,
-            "verify_token_configured": False,
-            "encrypt_key_configured": False,
-            "debounce_sec": 15,
-            "trigger_types": list(api_module.EVENT_DEFAULT_TRIGGER_TYPES),
-            "pending": False,
-            "last_received_at": None,
-            "last_event_type": None,
-            "last_event_id": None,
-            "last_challenge_at": None,
-            "last_trigger_requested_at": None,
-            "last_triggered_at": None,
-            "last_result": None,
-            "last_error": None,
-            "received_count": 0,
-            "trigger_count": 0,
-            "skipped_unmatched_count": 0,
-            "skipped_debounce_count": 0,
-            "skipped_busy_count": 0,
-            "skipped_pending_count": 0,
-            "skipped_disabled_count": 0,
-            "duplicate_count": 0,
-        }
-    )
+    api_module._event_state.update(api_module._EVENT_STATE_DEFAULTS)
 
 
 def _mock_cfg() -> AppConfig:
@@ -68,11 +46,9 @@ def _event_payload(event_id: str = "evt-1", event_type: str = "drive.file.edit_v
     }
 
 
-def test_event_url_verification_success(monkeypatch):
-    _reset_event_state()
+def test_event_url_verification_success(client, monkeypatch):
     monkeypatch.setattr(api_module, "load_config", lambda: _mock_cfg())
 
-    client = _build_client()
     resp = client.post(
         "/api/events/feishu",
         json={"type": "url_verification", "token": "verify-token-123", "challenge": "hello-world"},
@@ -82,8 +58,7 @@ def test_event_url_verification_success(monkeypatch):
     assert resp.json() == {"challenge": "hello-world"}
 
 
-def test_event_callback_queues_sync_when_event_type_matched(monkeypatch):
-    _reset_event_state()
+def test_event_callback_queues_sync_when_event_type_matched(client, monkeypatch):
     monkeypatch.setattr(api_module, "load_config", lambda: _mock_cfg())
     calls: list[tuple[str, str, int]] = []
 
@@ -93,7 +68,6 @@ def test_event_callback_queues_sync_when_event_type_matched(monkeypatch):
 
     monkeypatch.setattr(api_module, "_run_event_sync_job", _fake_run)
 
-    client = _build_client()
     resp = client.post("/api/events/feishu", json=_event_payload("evt-queue-1", "drive.file.edit_v1"))
 
     assert resp.status_code == 200
@@ -102,12 +76,10 @@ def test_event_callback_queues_sync_when_event_type_matched(monkeypatch):
     assert calls == [("drive.file.edit_v1", "evt-queue-1", 0)]
 
 
-def test_event_callback_unmatched_event_type_is_ignored(monkeypatch):
-    _reset_event_state()
+def test_event_callback_unmatched_event_type_is_ignored(client, monkeypatch):
     monkeypatch.setattr(api_module, "load_config", lambda: _mock_cfg())
     monkeypatch.setattr(api_module, "_run_event_sync_job", lambda *_args: None)
 
-    client = _build_client()
     resp = client.post("/api/events/feishu", json=_event_payload("evt-um-1", "im.message.receive_v1"))
 
     assert resp.status_code == 200
@@ -116,24 +88,20 @@ def test_event_callback_unmatched_event_type_is_ignored(monkeypatch):
     assert payload["reason"] == "unmatched_event_type"
 
 
-def test_event_callback_rejects_invalid_verify_token(monkeypatch):
-    _reset_event_state()
+def test_event_callback_rejects_invalid_verify_token(client, monkeypatch):
     monkeypatch.setattr(api_module, "load_config", lambda: _mock_cfg())
 
     bad = _event_payload("evt-bad-token", "drive.file.edit_v1")
     bad["header"]["token"] = "token-mismatch"
-    client = _build_client()
     resp = client.post("/api/events/feishu", json=bad)
 
     assert resp.status_code == 401
 
 
-def test_event_callback_dedups_same_event_id(monkeypatch):
-    _reset_event_state()
+def test_event_callback_dedups_same_event_id(client, monkeypatch):
     monkeypatch.setattr(api_module, "load_config", lambda: _mock_cfg())
     monkeypatch.setattr(api_module, "_run_event_sync_job", lambda *_args: None)
 
-    client = _build_client()
     first = client.post("/api/events/feishu", json=_event_payload("evt-dup-1", "drive.file.edit_v1"))
     second = client.post("/api/events/feishu", json=_event_payload("evt-dup-1", "drive.file.edit_v1"))
 
@@ -143,14 +111,27 @@ def test_event_callback_dedups_same_event_id(monkeypatch):
     assert second.json()["reason"] == "duplicate_event"
 
 
-def test_event_callback_returns_503_when_verify_token_missing(monkeypatch):
-    _reset_event_state()
+def test_event_callback_returns_503_when_verify_token_missing(client, monkeypatch):
     cfg = _mock_cfg()
     cfg.sync.event_verify_token = ""
     monkeypatch.setattr(api_module, "load_config", lambda: cfg)
 
-    client = _build_client()
     resp = client.post("/api/events/feishu", json=_event_payload("evt-no-token", "drive.file.edit_v1"))
 
     assert resp.status_code == 503
     assert resp.json()["detail"] == "event_verify_token_missing"
+
+
+def test_event_recent_ids_expire_from_the_front(monkeypatch):
+    monkeypatch.setattr(api_module, "EVENT_DEDUP_MAX_IDS", 3)
+    ttl = api_module.EVENT_DEDUP_TTL_SEC
+
+    assert api_module._event_seen_recently("a", 0.0) is False
+    assert api_module._event_seen_recently("b", 1.0) is False
+    assert api_module._event_seen_recently("a", 2.0) is True
+    assert api_module._event_seen_recently("c", ttl + 0.5) is False
+    assert list(api_module._event_recent_ids) == ["b", "c"]
+
+    api_module._event_seen_recently("d", ttl + 0.6)
+    api_module._event_seen_recently("e", ttl + 0.7)
+    assert list(api_module._event_recent_ids) == ["c", "d", "e"]
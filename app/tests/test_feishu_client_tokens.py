@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+from app.providers.feishu_legacy.feishu_client import FeishuClient
+
+
+def test_load_user_tokens_rereads_after_token_file_changes(tmp_path: Path):
+    token_file = tmp_path / "user_tokens.json"
+    token_file.write_text(json.dumps({"access_token": "a1"}), encoding="utf-8")
+    client = FeishuClient("app", "secret", str(token_file))
+
+    first = client._load_user_tokens()
+    assert first == {"access_token": "a1"}
+    first["access_token"] = "mutated"
+    assert client._load_user_tokens() == {"access_token": "a1"}
+
+    client._save_user_tokens({"access_token": "a2", "refresh_token": "r2"})
+    assert client._load_user_tokens() == {"access_token": "a2", "refresh_token": "r2"}
+
+    token_file.unlink()
+    assert client._load_user_tokens() is None
+
+
+def test_expired_user_token_is_refreshed_once_under_concurrency(tmp_path: Path):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    token_file = tmp_path / "user_tokens.json"
+    token_file.write_text(
+        json.dumps({"access_token": "old", "refresh_token": "r1", "created_at": 1, "expires_in": 7200}),
+        encoding="utf-8",
+    )
+    client = FeishuClient("app", "secret", str(token_file))
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    class FakeResponse:
+        content = json.dumps(
+            {"code": 0, "data": {"access_token": "new", "refresh_token": "r2", "expires_in": 7200}}
+        ).encode("utf-8")
+
+        def json(self):
+            return json.loads(self.content)
+
+    class FakeApi:
+        def post(self, url, json=None, timeout=None):
+            with lock:
+                calls.append(json["refresh_token"])
+            time.sleep(0.05)
+            return FakeResponse()
+
+    client._api = FakeApi()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = list(pool.map(lambda _i: client._user_access_token(), range(8)))
+
+    assert calls == ["r1"]
+    assert tokens == ["new"] * 8
+
+
+def test_concurrent_token_saves_from_separate_clients_do_not_collide(tmp_path: Path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    token_file = tmp_path / "user_tokens.json"
+    clients = [FeishuClient("app", "secret", str(token_file)) for _ in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: clients[i]._save_user_tokens({"access_token": f"a{i}"}), range(8)))
+
+    assert json.loads(token_file.read_text(encoding="utf-8"))["access_token"].startswith("a")
+    assert [p.name for p in tmp_path.iterdir()] == ["user_tokens.json"]
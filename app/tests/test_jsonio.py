@@ -0,0 +1,25 @@
+import json
+
+from app.core import jsonio
+
+
+def test_dumps_bytes_matches_stdlib_output(monkeypatch):
+    payload = {"local_root": "/数据/文档", "errors": 0, "notes": ["a", "b"], "nested": {"ok": True, "v": None}}
+    compact = jsonio.dumps_bytes(payload)
+    pretty = jsonio.dumps_bytes(payload, indent=True)
+
+    monkeypatch.setattr(jsonio, "orjson", None)
+    assert jsonio.dumps_bytes(payload) == compact
+    assert jsonio.dumps_bytes(payload, indent=True) == pretty
+    assert json.loads(compact) == payload
+
+
+def test_dumps_bytes_falls_back_for_values_orjson_rejects():
+    assert json.loads(jsonio.dumps_bytes({"size": 2**70})) == {"size": 2**70}
+
+
+def test_loads_bytes_with_and_without_orjson(monkeypatch):
+    raw = '{"name": "文档", "code": 0}'.encode("utf-8")
+    assert jsonio.loads_bytes(raw) == {"name": "文档", "code": 0}
+    monkeypatch.setattr(jsonio, "orjson", None)
+    assert jsonio.loads_bytes(raw) == {"name": "文档", "code": 0}
@@ -0,0 +1,21 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.core.local_watch import _LocalChangeHandler
+
+
+def test_local_change_handler_ignores_excluded_dirs_and_access_events(tmp_path: Path):
+    calls: list[int] = []
+    handler = _LocalChangeHandler(tmp_path, frozenset({".sync_trash"}), lambda: calls.append(1))
+
+    def _event(event_type: str, src: Path, dest: Path | None = None):
+        return SimpleNamespace(event_type=event_type, src_path=str(src), dest_path=str(dest) if dest else "")
+
+    handler.on_any_event(_event("opened", tmp_path / "a.md"))
+    handler.on_any_event(_event("modified", tmp_path / ".sync_trash" / "a.md"))
+    handler.on_any_event(_event("modified", Path("/elsewhere/a.md")))
+    assert calls == []
+
+    handler.on_any_event(_event("modified", tmp_path / "docs" / "a.md"))
+    handler.on_any_event(_event("moved", tmp_path / ".sync_trash" / "b.md", tmp_path / "b.md"))
+    assert calls == [1, 1]
@@ -28,3 +28,63 @@ def test_build_log_tail_payload_handles_missing_file(tmp_path: Path):
     payload = build_log_tail_payload(str(tmp_path / "missing.log"), n=20)
     assert payload["count"] == 0
     assert payload["tail"] == ""
+
+
+def test_build_log_tail_payload_can_omit_items(tmp_path: Path):
+    log_file = tmp_path / "service.log"
+    log_file.write_text("2026-02-22 10:00:00,000 [INFO] [scheduler] scheduler_started\n", encoding="utf-8")
+
+    payload = build_log_tail_payload(str(log_file), n=20, include_items=False)
+    assert payload["count"] == 1
+    assert "items" not in payload
+    assert "scheduler_started" in payload["tail"]
+
+
+def test_build_log_tail_payload_returns_only_lines_after_offset(tmp_path: Path):
+    log_file = tmp_path / "service.log"
+    log_file.write_text("2026-02-22 10:00:00,000 [INFO] [scheduler] first\n", encoding="utf-8")
+
+    first = build_log_tail_payload(str(log_file), n=20)
+    assert first["next_offset"] == log_file.stat().st_size
+
+    with log_file.open("a", encoding="utf-8") as fh:
+        fh.write("2026-02-22 10:01:00,000 [INFO] [sync] second\n")
+    second = build_log_tail_payload(str(log_file), n=20, since=first["next_offset"])
+    assert second["reset"] is False
+    assert second["count"] == 1
+    assert "second" in second["tail"] and "first" not in second["tail"]
+    assert second["next_offset"] == log_file.stat().st_size
+
+    log_file.write_text("2026-02-22 10:02:00,000 [INFO] [sync] rotated\n", encoding="utf-8")
+    third = build_log_tail_payload(str(log_file), n=20, since=second["next_offset"])
+    assert third["reset"] is True
+    assert "rotated" in third["tail"]
+
+
+def test_build_log_tail_payload_reads_only_the_tail_of_large_files(tmp_path: Path):
+    log_file = tmp_path / "service.log"
+    lines = [f"2026-02-22 10:00:00,000 [INFO] [sync] line-{i:06d}" for i in range(20000)]
+    log_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    payload = build_log_tail_payload(str(log_file), n=3, include_items=False)
+    assert payload["tail"].split("\n") == lines[-3:]
+    assert payload["next_offset"] == log_file.stat().st_size
+
+    filtered = build_log_tail_payload(str(log_file), n=5000, module="sync")
+    assert filtered["count"] == 5000
+    assert filtered["items"][0]["raw"] == lines[-5000]
+
+
+def test_build_log_tail_payload_does_not_split_a_partially_written_line(tmp_path: Path):
+    log_file = tmp_path / "service.log"
+    log_file.write_text("2026-02-22 10:00:00,000 [INFO] [sync] done\n2026-02-22 10:01:00,000 [INFO] [sy", encoding="utf-8")
+
+    first = build_log_tail_payload(str(log_file), n=20)
+    assert first["count"] == 1
+    assert "10:01" not in first["tail"]
+
+    with log_file.open("a", encoding="utf-8") as fh:
+        fh.write("nc] next\n")
+    second = build_log_tail_payload(str(log_file), n=20, since=first["next_offset"])
+    assert second["tail"] == "2026-02-22 10:01:00,000 [INFO] [sync] next"
+    assert second["next_offset"] == log_file.stat().st_size
@@ -0,0 +1,25 @@
+import logging
+from pathlib import Path
+
+from app.core import logging_setup
+
+
+def test_setup_logging_writes_through_queue_listener(tmp_path: Path):
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    logfile = tmp_path / "logs" / "service.log"
+    try:
+        logging_setup.setup_logging("info", str(logfile))
+        logging.getLogger("sync").debug("hidden")
+        logging.getLogger("sync").warning("visible")
+        logging_setup._stop_listener()
+    finally:
+        for h in list(root.handlers):
+            root.removeHandler(h)
+        for h in saved_handlers:
+            root.addHandler(h)
+        root.setLevel(saved_level)
+
+    text = logfile.read_text(encoding="utf-8")
+    assert "[WARNING] [sync] visible" in text
+    assert "hidden" not in text
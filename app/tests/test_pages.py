@@ -0,0 +1,58 @@
+import re
+
+from app.core.config import AppConfig
+from app.web import pages as pages_module
+
+
+def test_console_page_is_a_static_shell_without_config_values():
+    html = pages_module._PAGE_BODY.decode("utf-8")
+
+    assert re.search(r"__[A-Z_]+__", html) is None
+    assert "id='scopeBanner'" in html
+    assert 'id="fAppSecret" type="password" value=""' in html
+
+
+def test_console_page_links_content_versioned_static_assets():
+    html = pages_module._PAGE_BODY.decode("utf-8")
+
+    for name in ("console.css", "console.js"):
+        assert (pages_module.STATIC_DIR / name).is_file()
+        assert f"/static/{name}?v={pages_module._asset_version(name)}" in html
+
+
+def test_console_page_and_assets_are_gzip_encoded(monkeypatch, tmp_path):
+    from fastapi.testclient import TestClient
+
+    from app.web import main as main_module
+
+    cfg = AppConfig()
+    cfg.database.path = str(tmp_path / "runtime" / "service.db")
+    cfg.logging.file = str(tmp_path / "runtime" / "service.log")
+    monkeypatch.setattr(main_module, "load_config", lambda: cfg)
+
+    client = TestClient(main_module.build_app(), client=("127.0.0.1", 50000))
+    page = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert page.status_code == 200
+    assert page.headers["content-encoding"] == "gzip"
+
+    asset = re.search(r"/static/console\.js\?v=\w+", page.text).group(0)
+    script = client.get(asset, headers={"Accept-Encoding": "gzip"})
+    assert script.headers["content-encoding"] == "gzip"
+    assert script.headers["cache-control"] == pages_module.STATIC_CACHE_CONTROL
+
+
+def test_console_page_revalidates_with_etag():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    api = FastAPI()
+    api.include_router(pages_module.router)
+    client = TestClient(api)
+
+    first = client.get("/")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    again = client.get("/", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
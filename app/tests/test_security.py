@@ -0,0 +1,65 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.web.security import NetworkAllowlistMiddleware
+
+
+def _build_client(allowed_nets: list[str], client_host: str) -> TestClient:
+    api = FastAPI()
+    api.add_middleware(NetworkAllowlistMiddleware, allowed_nets=allowed_nets)
+
+    @api.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    return TestClient(api, client=(client_host, 50000))
+
+
+def test_allowlist_admits_addresses_inside_configured_networks():
+    nets = ["127.0.0.1/32", "192.168.1.0/24", "fd00::/8"]
+    assert _build_client(nets, "127.0.0.1").get("/ping").status_code == 200
+    assert _build_client(nets, "192.168.1.77").get("/ping").status_code == 200
+    assert _build_client(nets, "fd12::1").get("/ping").status_code == 200
+
+
+def test_allowlist_rejects_addresses_outside_configured_networks():
+    nets = ["127.0.0.1/32", "192.168.1.0/24", "fd00::/8"]
+    assert _build_client(nets, "192.168.2.1").get("/ping").status_code == 403
+    assert _build_client(nets, "127.0.0.2").get("/ping").status_code == 403
+    assert _build_client(nets, "fe80::1").get("/ping").status_code == 403
+    assert _build_client(nets, "not-an-ip").get("/ping").status_code == 403
+
+
+def test_allowlist_reports_invalid_network_config():
+    resp = _build_client(["10.0.0.0/33"], "127.0.0.1").get("/ping")
+    assert resp.status_code == 503
+    assert "10.0.0.0/33" in resp.text
+
+
+def test_allowlist_fast_paths_keep_per_version_semantics():
+    assert _build_client(["0.0.0.0/0"], "203.0.113.9").get("/ping").status_code == 200
+    assert _build_client(["0.0.0.0/0"], "2001:db8::1").get("/ping").status_code == 403
+    assert _build_client(["::1/128"], "::1").get("/ping").status_code == 200
+    assert _build_client(["::1/128"], "0:0:0:0:0:0:0:1").get("/ping").status_code == 200
+    assert _build_client(["::1/128"], "::2").get("/ping").status_code == 403
+
+
+def test_allowlist_matches_many_networks_sharing_a_prefix_length():
+    nets = [f"10.{i}.0.0/16" for i in range(0, 200, 2)] + ["172.16.0.0/12"]
+    assert _build_client(nets, "10.198.3.4").get("/ping").status_code == 200
+    assert _build_client(nets, "10.199.3.4").get("/ping").status_code == 403
+    assert _build_client(nets, "172.31.255.1").get("/ping").status_code == 200
+
+
+def test_get_allowed_nets_follows_env_changes(monkeypatch):
+    from app.web.security import get_allowed_nets
+
+    monkeypatch.delenv("ALLOWED_NETS", raising=False)
+    assert get_allowed_nets() == ["127.0.0.1/32"]
+    monkeypatch.setenv("ALLOWED_NETS", " 10.0.0.0/8, ,192.168.1.0/24 ")
+    assert get_allowed_nets() == ["10.0.0.0/8", "192.168.1.0/24"]
+
+
+def test_allowlist_rejects_requests_without_client_address():
+    resp = _build_client(["0.0.0.0/0", "::/0"], "").get("/ping")
+    assert resp.status_code == 403